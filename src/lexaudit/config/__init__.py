@@ -0,0 +1,5 @@
+"""LexAudit configuration (single settings instance per process)."""
+
+from .settings import SETTINGS, LexAuditSettings, get_settings
+
+__all__ = ["SETTINGS", "LexAuditSettings", "get_settings"]
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
+import json
+import shlex
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Annotated, Literal, Optional
 
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
-from dotenv import load_dotenv
-
-
-load_dotenv(Path(__file__).parent.parent.parent.parent / "config" / ".env")
+CONFIG_ENV_FILE = Path(__file__).resolve().parents[3] / "config" / ".env"
 
 
 class LexAuditSettings(BaseSettings):
-    linker_cmd: list[str] = [
+    # LINKER_CMD may be given as a shell-style string; it is split once at load
+    linker_cmd: Annotated[list[str], NoDecode] = [
         "docker",
         "run",
         "-i",
@@ -22,22 +24,42 @@ class LexAuditSettings(BaseSettings):
     ]
     linker_context: str = "federal"
     linker_timeout: Optional[float] = 1.0
+    # "persistent" keeps one container alive and runs the linker via docker exec;
+    # "one_shot" runs linker_cmd (a fresh container) for every document.
+    linker_mode: Literal["one_shot", "persistent"] = "persistent"
+    linker_container_name: str = "lexaudit_linker"
+    linker_image: str = "lexmlbr/lexml-linker:latest"
+    linker_binary: str = "/usr/bin/linkertool"
+    # Linker calls in flight at once, shared by every detector in the process
+    linker_max_parallel: int = 4
 
     # Snippet generation defaults
     snippet_min_chars: int = 120
     snippet_max_chars: Optional[int] = 600
     prefer_linker_edges: bool = True
+    # Blank texts and texts shorter than this skip detection entirely ("CF" is
+    # the shortest reference the scanner accepts)
+    min_detect_chars: int = 2
 
     llm_provider: str = "gemini"
     llm_model: str = "gemini-2.5-flash"
     llm_temperature: float = 0.0
+    # Suspects sent together in one identify/review prompt (1 = one call each,
+    # 0 = all suspects of a document in a single call)
+    identification_batch_size: int = 8
 
     serpapi_api_key: str = ""
     google_api_key: str = ""
     openai_api_key: str = ""
+    anthropic_api_key: str = ""
     # Logging
     logging_level: str = "INFO"
 
+    # Concurrent network calls per document (resolution and retrieval stages)
+    max_concurrency: int = 8
+    # Worker processes for LexAuditPipeline.process_batch (0 = cpu_count - 1)
+    ingest_workers: int = 1
+
     # Citation processing limit (for debugging)
     citations_to_process: Optional[int] = None
 
@@ -45,9 +67,25 @@ class LexAuditSettings(BaseSettings):
     validation_confidence_threshold: float = 0.75
     debate_rounds: int = 2
 
+    @field_validator("linker_cmd", mode="before")
+    @classmethod
+    def _split_linker_cmd(cls, value):
+        if isinstance(value, str):
+            # Keep accepting the JSON list form pydantic-settings decodes by default
+            if value.lstrip().startswith("["):
+                return json.loads(value)
+            return shlex.split(value)
+        return value
+
+    # Only the documented config/.env is read (once per process via get_settings)
     model_config = SettingsConfigDict(
-        env_file=".env", env_file_encoding="utf-8", extra="ignore"
+        env_file=CONFIG_ENV_FILE, env_file_encoding="utf-8", extra="ignore"
     )
 
 
-SETTINGS = LexAuditSettings()
+@lru_cache(maxsize=1)
+def get_settings() -> LexAuditSettings:
+    return LexAuditSettings()
+
+
+SETTINGS = get_settings()
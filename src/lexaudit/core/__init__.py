@@ -7,10 +7,12 @@ from .models import (
     RetrievedDocument,
     ValidatedCitation,
     ValidationStatus,
+    ValidationStatusLiteral,
 )
 
 __all__ = [
     "ValidationStatus",
+    "ValidationStatusLiteral",
     "ExtractedCitation",
     "ResolvedCitation",
     "RetrievedDocument",
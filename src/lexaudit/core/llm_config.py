@@ -2,14 +2,33 @@
 LLM configuration and factory for creating LangChain chat models.
 """
 
+import importlib
 import logging
-import os
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Type
 
 from langchain_core.language_models.chat_models import BaseChatModel
 
 from lexaudit.config.settings import SETTINGS
 
+logger = logging.getLogger(__name__)
+
+# provider -> (module, class); SDKs are only imported on first use
+_CHAT_MODEL_CLASSES: Dict[str, Tuple[str, str]] = {
+    "openai": ("langchain_openai", "ChatOpenAI"),
+    "google": ("langchain_google_genai", "ChatGoogleGenerativeAI"),
+    "gemini": ("langchain_google_genai", "ChatGoogleGenerativeAI"),
+    "anthropic": ("langchain_anthropic", "ChatAnthropic"),
+    "ollama": ("langchain_community.chat_models", "ChatOllama"),
+}
+
+
+@lru_cache(maxsize=None)
+def _load_chat_model_class(provider: str) -> Type[BaseChatModel]:
+    """Import and cache the chat model class for ``provider``."""
+    module_name, class_name = _CHAT_MODEL_CLASSES[provider]
+    return getattr(importlib.import_module(module_name), class_name)
+
 
 def create_llm(
     provider: Optional[str] = None,
@@ -31,31 +50,50 @@ def create_llm(
     provider = provider or SETTINGS.llm_provider
     model_name = model_name or SETTINGS.llm_model
     temperature = temperature if temperature is not None else SETTINGS.llm_temperature
+    return _build_chat_model(provider, model_name, temperature)
+
+
+@lru_cache(maxsize=None)
+def _build_chat_model(
+    provider: str, model_name: str, temperature: float
+) -> Optional[BaseChatModel]:
+    """
+    Build the chat model once per (provider, model, temperature).
+
+    Every pipeline component asks for its own client; sharing one instance
+    avoids repeating SDK setup and authentication for each of them.
+    """
+    if provider not in _CHAT_MODEL_CLASSES:
+        logger.warning("[LLM_CONFIG] Unknown provider '%s'", provider)
+        return None
 
     try:
-        if provider == "openai":
-            from langchain_openai import ChatOpenAI
+        chat_model_cls = _load_chat_model_class(provider)
+    except ImportError as e:
+        logger.warning(
+            "[LLM_CONFIG] Could not import %s client: %s. Install with: pip install %s",
+            provider,
+            e,
+            _CHAT_MODEL_CLASSES[provider][0].split(".")[0].replace("_", "-"),
+        )
+        return None
 
+    match provider:
+        case "openai":
             api_key = SETTINGS.openai_api_key
             if not api_key:
-                logging.getLogger(__name__).warning(
-                    "[LLM_CONFIG] openai_api_key not set"
-                )
+                logger.warning("[LLM_CONFIG] openai_api_key not set")
                 return None
-            return ChatOpenAI(
+            return chat_model_cls(
                 model=model_name, temperature=temperature, api_key=api_key
             )
 
-        elif provider in ["google", "gemini"]:
-            from langchain_google_genai import ChatGoogleGenerativeAI
-
+        case "google" | "gemini":
             api_key = SETTINGS.google_api_key
             if not api_key:
-                logging.getLogger(__name__).warning(
-                    "[LLM_CONFIG] google_api_key not set"
-                )
+                logger.warning("[LLM_CONFIG] google_api_key not set")
                 return None
-            return ChatGoogleGenerativeAI(
+            return chat_model_cls(
                 model=model_name,
                 temperature=temperature,
                 google_api_key=api_key,
@@ -63,32 +101,14 @@ def create_llm(
                 request_timeout=120,  # Alternative timeout parameter
             )
 
-        elif provider == "anthropic":
-            from langchain_anthropic import ChatAnthropic
-
-            api_key = os.getenv("ANTHROPIC_API_KEY")
+        case "anthropic":
+            api_key = SETTINGS.anthropic_api_key
             if not api_key:
-                logging.getLogger(__name__).warning(
-                    "[LLM_CONFIG] ANTHROPIC_API_KEY not set"
-                )
+                logger.warning("[LLM_CONFIG] anthropic_api_key not set")
                 return None
-            return ChatAnthropic(
+            return chat_model_cls(
                 model=model_name, temperature=temperature, api_key=api_key
             )
 
-        elif provider == "ollama":
-            from langchain_community.chat_models import ChatOllama
-
-            return ChatOllama(model=model_name, temperature=temperature)
-
-        else:
-            logging.getLogger(__name__).warning(
-                "[LLM_CONFIG] Unknown provider '%s'", provider
-            )
-            return None
-
-    except ImportError as e:
-        logger = logging.getLogger(__name__)
-        logger.warning("[LLM_CONFIG] Could not import %s client: %s", provider, e)
-        logger.info("[LLM_CONFIG] Install with: pip install langchain-%s", provider)
-        return None
+        case _:  # ollama
+            return chat_model_cls(model=model_name, temperature=temperature)
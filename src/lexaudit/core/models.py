@@ -2,23 +2,36 @@
 Data models for LexAudit pipeline.
 """
 
-from enum import Enum
-from typing import Any, Dict, List, Literal, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class ValidationStatus(Enum):
-    """Validation status of a citation."""
+ValidationStatusLiteral = Literal[
+    "pending", "correct", "outdated", "incorrect", "non_existent"
+]
 
-    PENDING = "pending"
-    CORRECT = "correct"
-    OUTDATED = "outdated"
-    INCORRECT = "incorrect"
-    NON_EXISTENT = "non_existent"
+
+class ValidationStatus:
+    """Validation status of a citation.
+
+    Kept as a namespace of plain string constants so existing
+    ``ValidationStatus.CORRECT`` references keep working; values are compared
+    and serialized as strings.
+    """
+
+    PENDING: ValidationStatusLiteral = "pending"
+    CORRECT: ValidationStatusLiteral = "correct"
+    OUTDATED: ValidationStatusLiteral = "outdated"
+    INCORRECT: ValidationStatusLiteral = "incorrect"
+    NON_EXISTENT: ValidationStatusLiteral = "non_existent"
 
 
 class IdentifiedCitation(BaseModel):
+    # Immutable and hashable so duplicates can be dropped with a set/dict
+    model_config = ConfigDict(frozen=True)
+
     identified_string: str = Field(
         ...,
         description="The string identified as a citation exactly as it appears in the text",
@@ -50,53 +63,72 @@ class IdentifiedCitations(BaseModel):
     )
 
 
-class ExtractedCitation(IdentifiedCitation):
-    """Identified citation enriched with positional/context metadata.
-
-    This supersedes the previous dataclass-based ExtractedCitation. It keeps the
-    textual fields from identification and adds positional/context info.
-    """
-
-    context_snippet: str = Field(
+class IndexedIdentifiedCitations(BaseModel):
+    index: int = Field(
         ...,
-        description="Full text snippet from which the citation was extracted",
-    )
-    start: Optional[int] = Field(
-        default=None,
-        description="Start index of the citation in the original text",
+        description="Number of the snippet these citations belong to",
     )
-    end: Optional[int] = Field(
-        default=None,
-        description="End index of the citation in the original text",
+    citations: List[IdentifiedCitation] = Field(
+        default_factory=list,
+        description="List of identified citations",
     )
 
 
-class CitationSuspect(BaseModel):
-    context_snippet: str = Field(
-        ...,
-        description="The snippet of the original text where the suspect was detected",
-    )
-    suspect_string: str = Field(
-        ...,
-        description="The string detected as a potential citation",
-    )
-    start: int = Field(
-        ...,
-        description="Start index of the suspect snippet in the original text",
-    )
-    end: int = Field(
-        ...,
-        description="End index of the suspect snippet in the original text",
-    )
-    detector_type: Literal["linker", "regex"] = Field(
-        ..., description="Type of detector that flagged this suspect"
-    )
-    identified_citations: List[IdentifiedCitation] = Field(
+class BatchIdentifiedCitations(BaseModel):
+    results: List[IndexedIdentifiedCitations] = Field(
         default_factory=list,
-        description="List of identified citations inside this suspect snippet",
+        description="Citations for each numbered snippet of the batch",
     )
 
 
+@dataclass(slots=True, kw_only=True)
+class ExtractedCitation:
+    """Identified citation enriched with positional/context metadata.
+
+    Plain data carrier: it keeps the textual fields from identification (already
+    validated on IdentifiedCitation) and adds positional/context info.
+    """
+
+    identified_string: str
+    formatted_name: str
+    citation_type: str
+    confidence: float = 0.0
+    justification: str = ""
+    # Full text snippet from which the citation was extracted
+    context_snippet: str
+    # Start/end indices of the citation in the original text
+    start: Optional[int] = None
+    end: Optional[int] = None
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class CitationSuspect:
+    """Span flagged by a detector as a potential citation.
+
+    Internal to extraction (never parsed from LLM output), so a plain slotted
+    dataclass; derive updated suspects with ``dataclasses.replace``.
+    """
+
+    # Snippet of the original text where the suspect was detected
+    context_snippet: str
+    # String detected as a potential citation
+    suspect_string: str
+    # Start/end indices of the suspect in the original text
+    start: int
+    end: int
+    # Detector that flagged this suspect
+    detector_type: Literal["linker", "regex"]
+    # Citations identified inside this suspect snippet
+    identified_citations: List[IdentifiedCitation] = field(default_factory=list)
+    # Where to look for the suspect's own (stripped) string in the text, set by
+    # the detector that found the span; None means compute it on demand
+    search_window: Optional[Tuple[int, int]] = None
+
+    def __hash__(self) -> int:
+        # identified_citations is a list; the span identifies the suspect
+        return hash((self.suspect_string, self.start, self.end, self.detector_type))
+
+
 class ResolutionOutput(BaseModel):
     """Structured output for citation resolution."""
 
@@ -129,26 +161,28 @@ class ResolutionOutput(BaseModel):
         return super().model_validate(obj, **kwargs)
 
 
-class ResolvedCitation(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ResolvedCitation:
     """Represents a citation with a resolved canonical identifier."""
 
     extracted_citation: ExtractedCitation
     canonical_id: Optional[str] = None
     resolution_confidence: float = 0.0
-    resolution_metadata: Dict[str, Any] = Field(default_factory=dict)
+    resolution_metadata: Dict[str, Any] = field(default_factory=dict)
 
     def __repr__(self):
         return f"ResolvedCitation(id={self.canonical_id}, confidence={self.resolution_confidence})"
 
 
-class RetrievedDocument(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class RetrievedDocument:
     """Represents a retrieved legal document."""
 
     canonical_id: str
     title: str
     full_text: str
     source: str
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
     def __repr__(self):
         return f"RetrievedDocument(id={self.canonical_id}, source={self.source})"
@@ -223,31 +257,54 @@ class ValidationOutput(BaseModel):
     final_justification: str
 
 
-class ValidatedCitation(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ValidatedCitation:
     """Represents a validated citation with RAG agent results."""
 
     resolved_citation: ResolvedCitation
     retrieved_document: Optional[RetrievedDocument] = None
-    validation_status: ValidationStatus = ValidationStatus.PENDING
+    validation_status: ValidationStatusLiteral = ValidationStatus.PENDING
     justification: str = ""
     confidence: float = 0.0
 
     def __repr__(self):
-        return f"ValidatedCitation(status={self.validation_status.value}, confidence={self.confidence})"
+        return f"ValidatedCitation(status={self.validation_status}, confidence={self.confidence})"
 
 
-class DocumentAnalysis(BaseModel):
-    """Complete analysis result for a document."""
+@dataclass(slots=True, kw_only=True)
+class DocumentAnalysis:
+    """Complete analysis result for a document.
+
+    Extracted and resolved citations are tuples: each stage sets them once and
+    later stages only read them.
+    """
 
     document_id: str
-    extracted_citations: List[ExtractedCitation] = Field(default_factory=list)
-    resolved_citations: List[ResolvedCitation] = Field(default_factory=list)
-    citation_retrievals: List[CitationRetrieval] = Field(default_factory=list)
-    validated_citations: List[ValidatedCitation] = Field(default_factory=list)
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    extracted_citations: Tuple[ExtractedCitation, ...] = ()
+    resolved_citations: Tuple[ResolvedCitation, ...] = ()
+    citation_retrievals: List[CitationRetrieval] = field(default_factory=list)
+    validated_citations: List[ValidatedCitation] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
     def __repr__(self):
         return (
             f"DocumentAnalysis(id={self.document_id}, "
             f"citations={len(self.extracted_citations)})"
         )
+
+
+# Schemas are normally built at class creation; rebuild any model left
+# incomplete (forward refs) now rather than on the first document processed.
+for _model in (
+    IdentifiedCitation,
+    IdentifiedCitations,
+    IndexedIdentifiedCitations,
+    BatchIdentifiedCitations,
+    ResolutionOutput,
+    CitationRetrieval,
+    TriageDecision,
+    DebateOutput,
+    ValidationOutput,
+):
+    _model.model_rebuild()
+del _model
@@ -3,14 +3,17 @@ LexAudit Pipeline - Orchestrates the full validation process.
 """
 
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Tuple
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from ..extraction.citation_extractor import CitationExtractor
+from ..extraction.detector import start_linker_container, stop_linker_container
 from ..retrieval.resolver import CitationResolver
-from ..retrieval.retriever import LegalDocumentRetriever
+from ..retrieval.retriever import LegalDocumentRetriever, create_http_session
 from ..validation.validator import CitationValidator
-from .models import CitationRetrieval, DocumentAnalysis
+from .models import CitationRetrieval, DocumentAnalysis, ResolvedCitation
 from ..config.settings import SETTINGS
 
 logger = logging.getLogger(__name__)
@@ -31,15 +34,20 @@ class LexAuditPipeline:
         """Initialize pipeline components."""
         self.extractor = CitationExtractor()
         self.resolver = CitationResolver()
-        self.retriever = LegalDocumentRetriever()
+        # One pooled keep-alive session for every retrieval this pipeline makes
+        self.http_session = create_http_session()
+        self.retriever = LegalDocumentRetriever(session=self.http_session)
         self.validator = CitationValidator()
+        # (formatted_name, citation_type) -> resolution, shared across documents
+        self._resolve_cache: Dict[Tuple[str, str], ResolvedCitation] = {}
 
     def process_document(
         self,
         document_id: str,
         text: str = "",
         pre_extracted_citations: List[str] = None,
-        max_retrieval_workers: int = 1,
+        max_retrieval_workers: Optional[int] = None,
+        max_resolution_workers: Optional[int] = None,
     ) -> DocumentAnalysis:
         """
         Process a document through the full pipeline.
@@ -48,130 +56,160 @@ class LexAuditPipeline:
             document_id: Unique identifier for the document
             text: Full text of the document (optional if pre_extracted_citations provided)
             pre_extracted_citations: Pre-extracted citations to forward (optional)
+            max_retrieval_workers: Concurrent retrievals (default: SETTINGS.max_concurrency)
+            max_resolution_workers: Concurrent resolutions (default: SETTINGS.max_concurrency)
 
         Returns:
             Complete document analysis
         """
+        if max_retrieval_workers is None:
+            max_retrieval_workers = SETTINGS.max_concurrency
+        if max_resolution_workers is None:
+            max_resolution_workers = SETTINGS.max_concurrency
+
         analysis = DocumentAnalysis(document_id=document_id, metadata={})
 
         # STAGE 1: Extraction
         logger.info("[STAGE 1] Extracting citations from document %s...", document_id)
 
-        analysis.extracted_citations = self.extractor.extract_from_text(text)
+        analysis.extracted_citations = tuple(self.extractor.extract_from_text(text))
 
         logger.info("  -> Extracted %d citations", len(analysis.extracted_citations))
 
         # STAGE 2: Resolution
         limit = SETTINGS.citations_to_process
-        sample_citations = (
-            analysis.extracted_citations[:limit]
-            if (limit is not None and limit >= 0)
-            else analysis.extracted_citations
-        )
-        logger.info(
-            "[STAGE 2] Resolving citations to canonical IDs (%s)...",
-            f"limit: {limit} citations"
-            if limit is not None and limit >= 0
-            else f"all {len(sample_citations)} citations",
-        )
-
-        for idx, citation in enumerate(sample_citations, 1):
+        if limit is None or limit < 0:
+            sample_citations = analysis.extracted_citations
             logger.info(
-                "  [%d/%d] Resolving: '%s' (type: %s)",
-                idx,
+                "[STAGE 2] Resolving citations to canonical IDs (all %d citations)...",
                 len(sample_citations),
-                citation.formatted_name,
-                citation.citation_type,
             )
-            resolved = self.resolver.resolve(citation)
-            analysis.resolved_citations.append(resolved)
-
-        logger.info("  -> Resolved %d citations", len(analysis.resolved_citations))
-        for resolved in analysis.resolved_citations[:3]:
+        else:
+            # Sort first so a given limit always picks the same citations
+            sample_citations = sorted(
+                analysis.extracted_citations, key=lambda c: c.formatted_name
+            )[:limit]
             logger.info(
-                "     - %s -> %s (conf: %.2f)",
-                resolved.extracted_citation.formatted_name,
-                resolved.canonical_id,
-                resolved.resolution_confidence,
+                "[STAGE 2] Resolving citations to canonical IDs (limit: %d citations)...",
+                limit,
             )
 
-        # Filter citations with valid URN:LEX identifiers
-        citations_with_urn = [
-            r
-            for r in analysis.resolved_citations
-            if r.canonical_id and r.canonical_id.startswith("urn:lex:br:")
+        # Documents repeat the same reference many times; resolve each distinct
+        # (name, type) once and reuse the result for the other occurrences.
+        positions_by_key: Dict[Tuple[str, str], List[int]] = {}
+        for pos, citation in enumerate(sample_citations):
+            key = (citation.formatted_name.lower(), citation.citation_type.lower())
+            positions_by_key.setdefault(key, []).append(pos)
+        distinct_keys = list(positions_by_key)
+        distinct_positions = list(positions_by_key.values())
+        distinct_citations = [sample_citations[p[0]] for p in distinct_positions]
+
+        resolved_slots: List[Optional[ResolvedCitation]] = [None] * len(
+            sample_citations
+        )
+        # canonical_id -> positions citing it; each id is retrieved only once
+        positions_by_urn: Dict[str, List[int]] = {}
+
+        def _resolutions() -> Iterator[Tuple[int, ResolvedCitation]]:
+            # Citations resolved for earlier documents are served from the cache;
+            # only successful resolutions are kept so failures get retried.
+            to_resolve: List[int] = []
+            for idx, key in enumerate(distinct_keys):
+                cached = self._resolve_cache.get(key)
+                if cached is not None:
+                    yield idx, cached
+                else:
+                    to_resolve.append(idx)
+            if len(to_resolve) < len(distinct_keys):
+                logger.info(
+                    "  -> %d of %d distinct citation(s) resolved from cache",
+                    len(distinct_keys) - len(to_resolve),
+                    len(distinct_keys),
+                )
+            for pending_idx, resolved in self.resolver.iter_resolve(
+                [distinct_citations[idx] for idx in to_resolve],
+                max_workers=max_resolution_workers,
+            ):
+                idx = to_resolve[pending_idx]
+                if resolved.canonical_id:
+                    self._resolve_cache[distinct_keys[idx]] = resolved
+                yield idx, resolved
+
+        def _resolved_with_urn() -> Iterator[ResolvedCitation]:
+            # Stages 2 and 3 overlap: a citation goes to retrieval as soon as its
+            # resolution completes, while the other LLM calls are still running.
+            for idx, resolved in _resolutions():
+                for pos in distinct_positions[idx]:
+                    occurrence = resolved
+                    if occurrence.extracted_citation is not sample_citations[pos]:
+                        occurrence = replace(
+                            resolved,
+                            extracted_citation=sample_citations[pos],
+                            resolution_metadata=dict(resolved.resolution_metadata),
+                        )
+                    resolved_slots[pos] = occurrence
+                    # Only citations with valid URN:LEX identifiers are retrieved
+                    urn = occurrence.canonical_id
+                    if urn and urn.startswith("urn:lex:br:"):
+                        if urn in positions_by_urn:
+                            positions_by_urn[urn].append(pos)
+                        else:
+                            positions_by_urn[urn] = [pos]
+                            yield occurrence
+
+        # STAGE 3: Retrieval (fed by Stage 2 as citations resolve)
+        logger.info(
+            "[STAGE 3] Retrieving official documents as citations resolve (workers=%d)...",
+            max_retrieval_workers,
+        )
+        streamed_retrievals = self.retriever.retrieve_batch(
+            _resolved_with_urn(), max_workers=max_retrieval_workers
+        )
+        # Fan each retrieval out to every occurrence of its URN, then restore
+        # document order (retrievals were submitted in resolution order)
+        retrievals_by_pos: Dict[int, CitationRetrieval] = {}
+        for urn, retrieval in zip(list(positions_by_urn), streamed_retrievals):
+            first, *others = positions_by_urn[urn]
+            retrievals_by_pos[first] = retrieval
+            for pos in others:
+                retrievals_by_pos[pos] = retrieval.model_copy(
+                    update={
+                        "resolved_citation": resolved_slots[pos],
+                        "retrieval_metadata": dict(retrieval.retrieval_metadata),
+                    }
+                )
+        citation_retrievals = [
+            retrievals_by_pos[pos] for pos in sorted(retrievals_by_pos)
         ]
-        skipped_count = len(analysis.resolved_citations) - len(citations_with_urn)
+        analysis.resolved_citations = tuple(resolved_slots)
+
+        logger.info(
+            "  -> Resolved %d citations (%d distinct)",
+            len(analysis.resolved_citations),
+            len(distinct_citations),
+        )
+        if logger.isEnabledFor(logging.INFO):
+            for resolved in analysis.resolved_citations[:3]:
+                logger.info(
+                    "     - %s -> %s (conf: %.2f)",
+                    resolved.extracted_citation.formatted_name,
+                    resolved.canonical_id,
+                    resolved.resolution_confidence,
+                )
+
+        skipped_count = len(analysis.resolved_citations) - len(citation_retrievals)
         if skipped_count > 0:
             logger.info(
-                "  -> Skipping %d citation(s) without valid URN:LEX identifier",
+                "  -> Skipped %d citation(s) without valid URN:LEX identifier",
                 skipped_count,
             )
 
-        # STAGE 3: Retrieval
-        logger.info(
-            "[STAGE 3] Retrieving official documents for %d citation(s) (workers=%d)...",
-            len(citations_with_urn),
-            max_retrieval_workers,
+        retrieved_count = sum(
+            1 for r in citation_retrievals if r.retrieval_status == "success"
+        )
+        error_count = sum(
+            1 for r in citation_retrievals if r.retrieval_status == "error"
         )
-
-        def _retrieve_single(resolved, shared_retriever=None) -> Tuple[str, object, str]:
-            """Retrieve a single citation using a dedicated retriever per worker."""
-            retriever = shared_retriever or LegalDocumentRetriever()
-            try:
-                doc = retriever.retrieve(resolved)
-                status = "success" if doc else "not_found"
-                return status, doc, ""
-            except Exception as exc:  # noqa: BLE001
-                logger.warning("Retrieval failed for %s: %s", resolved.canonical_id, exc)
-                return "error", None, str(exc)
-
-        retrieved_count = 0
-        error_count = 0
-        citation_retrievals = []
-
-        if max_retrieval_workers and max_retrieval_workers > 1:
-            with ThreadPoolExecutor(max_workers=max_retrieval_workers) as executor:
-                future_to_index = {
-                    executor.submit(_retrieve_single, resolved): i
-                    for i, resolved in enumerate(citations_with_urn)
-                }
-                results = [None] * len(citations_with_urn)
-                for future in as_completed(future_to_index):
-                    idx = future_to_index[future]
-                    try:
-                        status, document, err = future.result()
-                    except Exception as exc:  # noqa: BLE001
-                        status, document, err = "error", None, str(exc)
-                    results[idx] = (status, document, err)
-            for resolved, res in zip(citations_with_urn, results):
-                status, document, err = res
-                if status == "success":
-                    retrieved_count += 1
-                if status == "error":
-                    error_count += 1
-                retrieval = CitationRetrieval(
-                    resolved_citation=resolved,
-                    retrieved_document=document,
-                    retrieval_status=status,  # type: ignore[arg-type]
-                    retrieval_metadata={"error": err} if err else {},
-                )
-                citation_retrievals.append(retrieval)
-        else:
-            shared_retriever = self.retriever
-            for resolved in citations_with_urn:
-                status, document, err = _retrieve_single(resolved, shared_retriever)
-                if status == "success":
-                    retrieved_count += 1
-                if status == "error":
-                    error_count += 1
-                retrieval = CitationRetrieval(
-                    resolved_citation=resolved,
-                    retrieved_document=document,
-                    retrieval_status=status,  # type: ignore[arg-type]
-                    retrieval_metadata={"error": err} if err else {},
-                )
-                citation_retrievals.append(retrieval)
 
         analysis.citation_retrievals = citation_retrievals
         analysis.metadata["citation_retrievals"] = citation_retrievals
@@ -179,7 +217,7 @@ class LexAuditPipeline:
         logger.info(
             "  -> Retrieved %d documents (attempted=%d, skipped=%d, errors=%d, total=%d)",
             retrieved_count,
-            len(citations_with_urn),
+            len(citation_retrievals),
             skipped_count,
             error_count,
             len(analysis.resolved_citations),
@@ -197,13 +235,14 @@ class LexAuditPipeline:
             "  -> Validated %d citations",
             len(analysis.validated_citations),
         )
-        for validated in analysis.validated_citations[:3]:
-            logger.info(
-                "     - %s -> %s (conf: %.2f)",
-                validated.resolved_citation.extracted_citation.formatted_name,
-                validated.validation_status.value,
-                validated.confidence,
-            )
+        if logger.isEnabledFor(logging.INFO):
+            for validated in analysis.validated_citations[:3]:
+                logger.info(
+                    "     - %s -> %s (conf: %.2f)",
+                    validated.resolved_citation.extracted_citation.formatted_name,
+                    validated.validation_status,
+                    validated.confidence,
+                )
 
         # Save detailed results to JSON
         self._save_results(document_id, analysis, validation_outputs)
@@ -224,17 +263,14 @@ class LexAuditPipeline:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filepath = output_dir / f"validation_{document_id}_{timestamp}.json"
 
+        with_urn = sum(1 for r in analysis.resolved_citations if r.canonical_id)
         output_data = {
             "document_id": document_id,
             "timestamp": timestamp,
             "summary": {
                 "total_extracted": len(analysis.extracted_citations),
-                "with_urn": len(
-                    [r for r in analysis.resolved_citations if r.canonical_id]
-                ),
-                "without_urn": len(
-                    [r for r in analysis.resolved_citations if not r.canonical_id]
-                ),
+                "with_urn": with_urn,
+                "without_urn": len(analysis.resolved_citations) - with_urn,
                 "validated": len(analysis.validated_citations),
             },
             "citations": [
@@ -256,25 +292,78 @@ class LexAuditPipeline:
 
         logger.info("  -> Saved results to: %s", filepath)
 
-    def process_batch(self, documents: List[dict]) -> List[DocumentAnalysis]:
+    def process_batch(
+        self,
+        documents: List[dict],
+        max_workers: int = 1,
+        ingest_workers: Optional[int] = None,
+    ) -> List[DocumentAnalysis]:
         """
         Process multiple documents.
 
+        Documents are independent and each stage mostly waits on network I/O,
+        so with ``max_workers > 1`` they are processed concurrently in threads.
+        With ``ingest_workers > 1`` they are spread over worker processes
+        instead, each holding its own pipeline, which also uses spare cores for
+        the CPU-bound detection work.
+
         Args:
             documents: List of document dicts with 'id' and 'citations' keys
+            max_workers: Number of documents processed concurrently in threads
+            ingest_workers: Worker processes (default: SETTINGS.ingest_workers;
+                0 means ``os.cpu_count() - 1``)
 
         Returns:
-            List of document analyses
+            List of document analyses, in the same order as ``documents``
         """
-        results = []
+        if ingest_workers is None:
+            ingest_workers = SETTINGS.ingest_workers
+        if ingest_workers == 0:
+            ingest_workers = max(1, (os.cpu_count() or 2) - 1)
+        if ingest_workers > 1 and len(documents) > 1:
+            # Workers reuse the parent's linker container rather than each
+            # starting one that nothing would stop; the parent owns it
+            owns_linker = start_linker_container()
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=min(ingest_workers, len(documents)),
+                    initializer=_init_worker_pipeline,
+                ) as executor:
+                    return list(executor.map(_process_in_worker, documents))
+            finally:
+                if owns_linker:
+                    stop_linker_container()
+
+        if not max_workers or max_workers <= 1 or len(documents) <= 1:
+            return [self._process_batch_item(doc) for doc in documents]
+
+        results = [None] * len(documents)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_index = {
+                executor.submit(self._process_batch_item, doc): i
+                for i, doc in enumerate(documents)
+            }
+            for future in as_completed(future_to_index):
+                results[future_to_index[future]] = future.result()
 
-        for doc in documents:
-            doc_id = doc.get("id", "unknown")
-            citations = doc.get("citations", [])
+        return results
 
-            analysis = self.process_document(
-                document_id=doc_id, pre_extracted_citations=citations
-            )
-            results.append(analysis)
+    def _process_batch_item(self, doc: dict) -> DocumentAnalysis:
+        return self.process_document(
+            document_id=doc.get("id", "unknown"),
+            pre_extracted_citations=doc.get("citations", []),
+        )
 
-        return results
+
+# Per-process pipeline for process_batch(ingest_workers > 1), built once by the
+# pool initializer so models and clients are not re-created for every document.
+_worker_pipeline: Optional[LexAuditPipeline] = None
+
+
+def _init_worker_pipeline() -> None:
+    global _worker_pipeline
+    _worker_pipeline = LexAuditPipeline()
+
+
+def _process_in_worker(doc: dict) -> DocumentAnalysis:
+    return _worker_pipeline._process_batch_item(doc)
@@ -1,15 +1,40 @@
 from __future__ import annotations
 
+import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.output_parsers import JsonOutputParser
 
+try:  # optional: faster decoding of fallback (non-structured) responses
+    import orjson
+except ImportError:
+    orjson = None
+
 from lexaudit.core.llm_config import create_llm
-from lexaudit.core.models import IdentifiedCitations
-from lexaudit.prompts.identification import IDENTIFICATION_PROMPT
-from lexaudit.prompts.review import REVIEW_PROMPT
+from lexaudit.core.models import BatchIdentifiedCitations, IdentifiedCitations
+from lexaudit.prompts.identification import (
+    IDENTIFICATION_BATCH_PROMPT,
+    IDENTIFICATION_PROMPT,
+)
+from lexaudit.prompts.review import REVIEW_BATCH_PROMPT, REVIEW_PROMPT
+
+# Stateless; only used for responses that are not plain JSON (e.g. fenced)
+_LENIENT_JSON_PARSER = JsonOutputParser()
+
+
+def _parse_json_content(content: str) -> Any:
+    """Decode a raw JSON response, tolerating markdown fences and extra text."""
+    try:
+        return orjson.loads(content) if orjson is not None else json.loads(content)
+    except ValueError:
+        return _LENIENT_JSON_PARSER.parse(content)
+
+
+def _numbered(blocks: List[str]) -> str:
+    """Number blocks from 1 as ``[i]`` headers, the indexes a grouped answer echoes."""
+    return "\n\n".join(f"[{i}]\n{block}" for i, block in enumerate(blocks, 1))
 
 
 class StructuredLLM:
@@ -31,6 +56,8 @@ class StructuredLLM:
                 else "unconfigured"
             )
         self.model_name = resolved_name
+        # (id(prompt), schema) -> runnable; prompts are module-level constants
+        self._chain_cache: Dict[Tuple[int, Any], Any] = {}
         logger.info(
             "Initialized chat model class=%s model_name=%s available=%s",
             type(self.llm).__name__ if self.llm else None,
@@ -45,48 +72,51 @@ class StructuredLLM:
     def chain(self, prompt, schema_model):
         if not self.llm:
             return None
+        key = (id(prompt), schema_model)
+        if key in self._chain_cache:
+            return self._chain_cache[key]
+        built = None
         if hasattr(self.llm, "with_structured_output"):
             try:
-                return prompt | self.llm.with_structured_output(schema_model)
+                built = prompt | self.llm.with_structured_output(schema_model)
             except Exception:
-                return None
-        return None
+                built = None
+        self._chain_cache[key] = built
+        return built
 
     def invoke(self, prompt, values: Dict[str, Any], schema_model):
         if not self.llm:
             raise RuntimeError("LLM not configured")
         ch = self.chain(prompt, schema_model)
         if ch is not None:
-            logger.info(
+            logger.debug(
                 "Invoking structured chain (model=%s) with keys=%s",
                 self.model_name,
                 list(values.keys()),
             )
             result = ch.invoke(values)
-            try:
-                logger.info(
-                    "Structured output: %s...",
-                    result.model_dump_json(ensure_ascii=False)[:100],
-                )
-            except Exception:
-                logger.debug("[LLM] Structured output parsed")
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    logger.debug(
+                        "Structured output: %s...",
+                        result.model_dump_json(ensure_ascii=False)[:100],
+                    )
+                except Exception:
+                    logger.debug("[LLM] Structured output parsed")
             return result
         # Fallback
         messages = prompt.format_messages(**values)
-        logger.info(
+        logger.debug(
             "Invoking fallback chain (model=%s) with keys=%s",
             self.model_name,
             list(values.keys()),
         )
         response = self.llm.invoke(messages)
-        try:
-            content = str(getattr(response, "content", ""))
-            logger.info("Raw response: %s...", content[:100])
-        except Exception:
-            logger.debug("Received response")
-        parser = JsonOutputParser(pydantic_object=schema_model)
-        parsed = parser.parse(response.content)
-        return schema_model.model_validate(parsed)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Raw response: %s...", str(getattr(response, "content", ""))[:100]
+            )
+        return schema_model.model_validate(_parse_json_content(response.content))
 
 
 class IdentifierLLM:
@@ -120,6 +150,24 @@ class IdentifierLLM:
         values = {"context_snippet": context_snippet, "proposals_json": proposals_json}
         return self._core.invoke(REVIEW_PROMPT, values, IdentifiedCitations)
 
+    # Identificação agrupada: vários trechos numerados (a partir de 1) em uma
+    # única chamada; a resposta associa as citações ao número de cada trecho
+    def identify_grouped(self, context_snippets: List[str]) -> BatchIdentifiedCitations:
+        values = {"numbered_snippets": _numbered(context_snippets)}
+        return self._core.invoke(
+            IDENTIFICATION_BATCH_PROMPT, values, BatchIdentifiedCitations
+        )
+
+    # Revisão agrupada: pares (context_snippet, proposals_json) numerados
+    def review_grouped(self, items: List[Tuple[str, str]]) -> BatchIdentifiedCitations:
+        blocks = [
+            f"Trecho (context_snippet):\n{snippet}\n"
+            f"Citações propostas (JSON):\n{proposals_json}"
+            for snippet, proposals_json in items
+        ]
+        values = {"numbered_items": _numbered(blocks)}
+        return self._core.invoke(REVIEW_BATCH_PROMPT, values, BatchIdentifiedCitations)
+
 
 __all__ = ["StructuredLLM", "IdentifierLLM"]
 logger = logging.getLogger(__name__)
@@ -2,17 +2,63 @@
 Citation extraction orchestrator.
 """
 
+import hashlib
 import logging
-from typing import List, Optional
+import threading
+from bisect import bisect_left
+from dataclasses import replace
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from .context_snippets import enhance_citation_snippet
+try:  # optional: locates all needles in a single pass over the text
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+from .context_snippets import _paragraph_ranges, enhance_citation_snippet
 from ..core.models import CitationSuspect, ExtractedCitation, IdentifiedCitation
 from .detector import CitationDetector
+from .detector.snippets import needle_search_window
 from .identification import CitationIdentifier
 from ..config.settings import SETTINGS
 
 logger = logging.getLogger(__name__)
 
+# Documents whose extraction results are kept per extractor (FIFO eviction)
+_EXTRACTION_CACHE_SIZE = 128
+
+
+class _NeedleIndex:
+    """Sorted start offsets of every occurrence of each needle in ``text``."""
+
+    def __init__(self, text: str, needles: Iterable[str]) -> None:
+        self._positions: Dict[str, List[int]] = {n: [] for n in needles if n}
+        if ahocorasick is not None and len(self._positions) > 1:
+            automaton = ahocorasick.Automaton()
+            for needle in self._positions:
+                automaton.add_word(needle, needle)
+            automaton.make_automaton()
+            for end, needle in automaton.iter(text):
+                self._positions[needle].append(end - len(needle) + 1)
+        else:
+            for needle, positions in self._positions.items():
+                idx = text.find(needle)
+                while idx != -1:
+                    positions.append(idx)
+                    idx = text.find(needle, idx + 1)
+
+    def find(self, needle: str, window_start: int, window_end: int) -> int:
+        """
+        Same result as ``text.find(needle, window_start, window_end)``, falling
+        back to ``text.find(needle)`` when there is no match inside the window.
+        """
+        positions = self._positions.get(needle)
+        if not positions:
+            return -1
+        i = bisect_left(positions, window_start)
+        if i < len(positions) and positions[i] + len(needle) <= window_end:
+            return positions[i]
+        return positions[0]
+
 
 class CitationExtractor:
     """
@@ -27,8 +73,47 @@ class CitationExtractor:
     ) -> None:
         self.detector = detector or CitationDetector()
         self.identifier = identifier or CitationIdentifier()
+        # (content digest, citation limit) -> extracted citations. Like the
+        # identifier's snippet cache, off when LLM outputs are sampled
+        self._cache: Optional[
+            Dict[Tuple[bytes, Optional[int]], List[ExtractedCitation]]
+        ] = {} if self.identifier.temperature == 0 else None
+        # process_batch may share one extractor across document threads
+        self._cache_lock = threading.Lock()
 
     def extract_from_text(self, text: str) -> List[ExtractedCitation]:
+        if self._cache is None:
+            return self._extract(text)[0]
+        key = (
+            hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(),
+            SETTINGS.citations_to_process,
+        )
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            logger.info(
+                "Reusing %d extracted citations for identical text (text_len=%d)",
+                len(cached),
+                len(text),
+            )
+            # ExtractedCitation is mutable: each document gets its own copies
+            return [replace(c) for c in cached]
+
+        extracted, complete = self._extract(text)
+        if not complete:
+            return extracted
+        with self._cache_lock:
+            if key not in self._cache and len(self._cache) >= _EXTRACTION_CACHE_SIZE:
+                self._cache.pop(next(iter(self._cache)), None)
+            self._cache[key] = extracted
+        return [replace(c) for c in extracted]
+
+    def _extract(self, text: str) -> Tuple[List[ExtractedCitation], bool]:
+        """
+        Extracted citations of ``text``, and whether every suspect sent to the
+        LLM came back identified. An empty identification may be an LLM that
+        was unavailable or a failed call, so such a result is not cached.
+        """
         logger.info("Starting pipeline (text_len=%d)", len(text))
 
         # Detect suspects
@@ -36,40 +121,56 @@ class CitationExtractor:
         logger.info("Detector returned %d suspects", len(suspects))
         if not suspects:
             logger.info("No suspects detected; returning empty result")
-            return []
-
-        # Split suspects by type
-        regex_suspects = [s for s in suspects if s.detector_type == "regex"]
-        linker_detections = [s for s in suspects if s.detector_type == "linker"]
-        logger.info(
-            "Split suspects: regex=%d linker=%d",
-            len(regex_suspects),
-            len(linker_detections),
-        )
+            return [], True
 
-        # Apply citation processing limit if configured
+        # Split suspects by type, applying the processing limit (if configured)
+        # while splitting so no discarded lists are built
         limit = SETTINGS.citations_to_process
-        if limit is not None and limit >= 0:
-            regex_suspects = regex_suspects[:limit]
-            linker_detections = linker_detections[:limit]
+        if limit is not None and limit < 0:
+            limit = None
+        regex_suspects: List[CitationSuspect] = []
+        linker_detections: List[CitationSuspect] = []
+        for suspect in suspects:
+            bucket = (
+                regex_suspects
+                if suspect.detector_type == "regex"
+                else linker_detections
+            )
+            if limit is None or len(bucket) < limit:
+                bucket.append(suspect)
+        if limit is not None:
             logger.info(
                 "Applied limit of %d citations: regex=%d linker=%d",
                 limit,
                 len(regex_suspects),
                 len(linker_detections),
             )
+        else:
+            logger.info(
+                "Split suspects: regex=%d linker=%d",
+                len(regex_suspects),
+                len(linker_detections),
+            )
 
-        # Identify citations for regex suspects only
-        logger.info("Running identification for %d regex suspects", len(regex_suspects))
-        identified_regexes = (
-            self.identifier.identify_citations(text, regex_suspects)
-            if regex_suspects
-            else []
+        # Suspects that already carry citations skip the LLM
+        need_llm = [s for s in regex_suspects if not s.identified_citations]
+        logger.info(
+            "Running identification for %d of %d regex suspects",
+            len(need_llm),
+            len(regex_suspects),
+        )
+        identified = iter(
+            self.identifier.identify_citations(text, need_llm) if need_llm else []
         )
+        # identify_citations keeps input order; merge back into suspect order
+        identified_regexes = [
+            s if s.identified_citations else next(identified, s) for s in regex_suspects
+        ]
         logger.info(
             "Identification complete; %d suspects returned with citations",
             len(identified_regexes),
         )
+        complete = all(s.identified_citations for s in identified_regexes)
 
         # Combine all suspects to normalize: regex (identified) + linker (as is)
         suspects_to_normalize = identified_regexes + linker_detections
@@ -77,43 +178,69 @@ class CitationExtractor:
             "Normalizing %d suspects (regex+linker)", len(suspects_to_normalize)
         )
 
+        # The LLM may repeat a citation within one suspect; drop exact duplicates
+        pairs = [
+            (suspect, citation)
+            for suspect in suspects_to_normalize
+            for citation in dict.fromkeys(suspect.identified_citations or [])
+        ]
+        # Locate every needle once instead of a text.find per citation
+        needle_index = _NeedleIndex(
+            text,
+            {
+                (citation.identified_string or suspect.suspect_string).strip()
+                for suspect, citation in pairs
+            },
+        )
+
         extracted: List[ExtractedCitation] = []
-        for suspect in suspects_to_normalize:
-            for citation in suspect.identified_citations or []:
-                try:
-                    item = self._to_extracted(text, suspect, citation)
-                    if item is not None:
-                        extracted.append(item)
-                except Exception:
-                    # Already logged inside _to_extracted
-                    continue
+        for suspect, citation in pairs:
+            try:
+                item = self._to_extracted(
+                    text, suspect, citation, needle_index=needle_index
+                )
+                if item is not None:
+                    extracted.append(item)
+            except Exception:
+                # Already logged inside _to_extracted
+                continue
 
         logger.info("Produced %d extracted citations", len(extracted))
 
         if text and extracted:
             logger.info("Enhancing context snippets for %d citations", len(extracted))
-            extracted = [
-                enhance_citation_snippet(text, citation) for citation in extracted
-            ]
+            paragraphs = _paragraph_ranges(text)
+            for citation in extracted:
+                enhance_citation_snippet(text, citation, paragraphs=paragraphs)
 
-        return extracted
+        return extracted, complete
 
     def _to_extracted(
         self,
         text: str,
         suspect: CitationSuspect,
         citation: IdentifiedCitation,
+        needle_index: Optional[_NeedleIndex] = None,
     ) -> Optional[ExtractedCitation]:
         needle = (citation.identified_string or suspect.suspect_string).strip()
         start_idx, end_idx = None, None
 
         if needle:
             # tenta localizar próximo do span do suspect (janela pequena), depois global
-            window_start = max(0, suspect.start - len(needle))
-            window_end = min(len(text), suspect.end + len(needle))
-            idx = text.find(needle, window_start, window_end)
-            if idx == -1:
-                idx = text.find(needle)
+            if suspect.search_window is not None and needle == (
+                suspect.suspect_string.strip()
+            ):
+                window_start, window_end = suspect.search_window
+            else:
+                window_start, window_end = needle_search_window(
+                    text, suspect.start, suspect.end, needle
+                )
+            if needle_index is not None:
+                idx = needle_index.find(needle, window_start, window_end)
+            else:
+                idx = text.find(needle, window_start, window_end)
+                if idx == -1:
+                    idx = text.find(needle)
             if idx != -1:
                 start_idx = idx
                 end_idx = idx + len(needle)
@@ -141,9 +268,9 @@ class CitationExtractor:
         """
         Forward already extracted citations (from external source strings).
 
-        Uses the lightweight guess_citation_type helper for classification and stores the string as
-        both identified_string and formatted_name. The full string is used as
-        context_snippet and positions are unknown (None).
+        No classification is attempted (citation_type is "unknown"); the string
+        is stored as both identified_string and formatted_name. The full string
+        is used as context_snippet and positions are unknown (None).
         """
         extracted: List[ExtractedCitation] = []
 
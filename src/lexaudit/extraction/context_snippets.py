@@ -5,11 +5,17 @@ Helpers for building expanded context snippets around citations.
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
 from typing import List, Optional, Tuple
 
 from lexaudit.extraction.detector.snippets import _is_hard_break
 from lexaudit.core.models import ExtractedCitation
 
+# Two or more newlines, optionally with whitespace in between
+_BLANK_LINE_RE = re.compile(r"\n\s*\n+")
+# Every position _is_hard_break can accept: sentence punctuation or a "\n\n"
+_HARD_BREAK_CANDIDATE_RE = re.compile(r"[.!?]|(?<=\n)\n")
+
 
 def _paragraphs_from_blank_lines(text: str) -> List[Tuple[int, int]]:
     """
@@ -19,7 +25,7 @@ def _paragraphs_from_blank_lines(text: str) -> List[Tuple[int, int]]:
     ranges: List[Tuple[int, int]] = []
     last = 0
 
-    for match in re.finditer(r"\n\s*\n+", text):
+    for match in _BLANK_LINE_RE.finditer(text):
         start = match.start()
         if start > last:
             ranges.append((last, start))
@@ -48,11 +54,13 @@ def _paragraphs_from_sentences(
     if not text:
         return [(0, 0)]
 
-    # Find sentence boundaries (end indices, half-open ranges)
-    bounds: List[int] = []
-    for i in range(len(text)):
-        if _is_hard_break(text, i):
-            bounds.append(i + 1)
+    # Find sentence boundaries (end indices, half-open ranges). The regex jumps
+    # straight to candidate characters so the heuristic only runs on those.
+    bounds: List[int] = [
+        m.start() + 1
+        for m in _HARD_BREAK_CANDIDATE_RE.finditer(text)
+        if _is_hard_break(text, m.start())
+    ]
 
     if not bounds or bounds[-1] < len(text):
         bounds.append(len(text))
@@ -103,14 +111,77 @@ def _paragraph_ranges(text: str) -> List[Tuple[int, int]]:
     return _paragraphs_from_sentences(text, sentences_per_paragraph=5)
 
 
+def _local_paragraphs(
+    text: str, start: int, window: int = 4096
+) -> Optional[List[Tuple[int, int]]]:
+    """
+    Paragraphs around ``start`` computed from ``text[start - window:start +
+    window]`` only, with offsets in ``text`` coordinates.
+
+    Returns the paragraph holding ``start`` and its neighbours exactly as
+    ``_paragraph_ranges(text)`` would, or None when the window cannot
+    guarantee that (sentence-grouped text, ``start`` between paragraphs, or a
+    neighbour cut by the window edge).
+    """
+    if "\n" not in text:
+        # Sentence grouping counts from the start of the document
+        return None
+
+    lo = max(0, start - window)
+    hi = min(len(text), start + window)
+    separators = list(_BLANK_LINE_RE.finditer(text, lo, hi))
+    # A separator cut by the window edge may be shorter than the real one, so
+    # only boundaries past the first / before the last separator are exact.
+    if lo > 0:
+        if not separators:
+            return None
+        left = separators[0].end()
+    else:
+        left = 0
+    if hi < len(text):
+        if not separators:
+            return None
+        right = separators[-1].start()
+    else:
+        right = len(text)
+
+    ranges: List[Tuple[int, int]] = []
+    last = left
+    for match in separators:
+        if match.start() < left or match.end() > right:
+            continue
+        if match.start() > last:
+            ranges.append((last, match.start()))
+        last = match.end()
+    if last < right:
+        ranges.append((last, right))
+
+    for idx, (p_start, p_end) in enumerate(ranges):
+        if p_start <= start < p_end or (
+            start == len(text) and p_start <= start <= p_end
+        ):
+            break
+    else:
+        return None
+    if (idx == 0 and lo > 0) or (idx == len(ranges) - 1 and hi < len(text)):
+        return None
+    return ranges[max(0, idx - 1) : idx + 2]
+
+
 def build_three_paragraph_snippet(
     text: str,
     start: Optional[int],
     end: Optional[int] = None,
+    paragraphs: Optional[List[Tuple[int, int]]] = None,
 ) -> str:
     """
     Build a snippet containing the paragraph where ``start`` occurs, plus the
     immediate previous and next paragraphs (when available).
+
+    ``paragraphs`` may carry ``_paragraph_ranges(text)`` precomputed by the
+    caller, so it is built once per document rather than once per citation.
+    Without it, only a window around ``start`` is scanned when that is enough
+    to find the three paragraphs.
     """
     if not text:
         return ""
@@ -119,15 +190,24 @@ def build_three_paragraph_snippet(
         return text.strip()
 
     start = max(0, min(start, len(text)))
-    paragraphs = _paragraph_ranges(text)
+    if paragraphs is None:
+        window = 4096
+        while window < len(text):
+            paragraphs = _local_paragraphs(text, start, window)
+            if paragraphs is not None:
+                break
+            window *= 4
+        else:
+            paragraphs = _paragraph_ranges(text)
     center_idx = len(paragraphs) - 1
 
-    for idx, (p_start, p_end) in enumerate(paragraphs):
-        if p_start <= start < p_end or (
-            start == len(text) and p_start <= start <= p_end
-        ):
+    # Ranges are sorted and disjoint: the candidate is the last one starting
+    # at or before ``start``.
+    idx = bisect_right(paragraphs, (start, len(text) + 1)) - 1
+    if idx >= 0:
+        p_start, p_end = paragraphs[idx]
+        if start < p_end or (start == len(text) and start <= p_end):
             center_idx = idx
-            break
 
     indices: List[int] = []
     if center_idx - 1 >= 0:
@@ -149,6 +229,7 @@ def build_three_paragraph_snippet(
 def enhance_citation_snippet(
     full_text: str,
     citation: ExtractedCitation,
+    paragraphs: Optional[List[Tuple[int, int]]] = None,
 ) -> ExtractedCitation:
     """
     Expand ``citation.context_snippet`` to include three paragraphs around the
@@ -161,6 +242,7 @@ def enhance_citation_snippet(
         full_text,
         citation.start,
         citation.end,
+        paragraphs=paragraphs,
     )
     if expanded:
         citation.context_snippet = expanded
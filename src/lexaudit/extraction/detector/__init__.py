@@ -2,7 +2,13 @@ from __future__ import annotations
 
 from .citation_detector import CitationDetector, CitationDetectorMetrics
 from .deduplicator import deduplicate
-from .linker_adapter import LinkerExecutionError, LinkerParsingError, run_linker
+from .linker_adapter import (
+    LinkerExecutionError,
+    LinkerParsingError,
+    run_linker,
+    start_linker_container,
+    stop_linker_container,
+)
 from .pattern_scanner import run_scanner
 
 """Detector subpackage: regex scanner, linker adapter, and orchestration.
@@ -18,6 +24,8 @@ __all__ = [
     "deduplicate",
     "run_scanner",
     "run_linker",
+    "start_linker_container",
+    "stop_linker_container",
     "LinkerExecutionError",
     "LinkerParsingError",
 ]
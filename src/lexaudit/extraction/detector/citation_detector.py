@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from time import perf_counter
 from typing import Dict, List, Optional, Sequence, Tuple
 
@@ -16,6 +17,33 @@ logger = logging.getLogger(__name__)
 
 CitationDetectorMetrics = Dict[str, float]
 
+# The linker is subprocess-bound (the GIL is released while it runs), so a
+# thread pool overlaps it with the CPU-bound scanner and caps how many linker
+# calls all documents have in flight together
+_LINKER_POOL = ThreadPoolExecutor(
+    max_workers=max(1, SETTINGS.linker_max_parallel), thread_name_prefix="linker"
+)
+
+
+def _timed_linker(
+    text: str,
+    command: Optional[Sequence[str]],
+    context: str,
+    timeout: Optional[float],
+) -> Tuple[List[CitationSuspect], float]:
+    tl0 = perf_counter()
+    try:
+        citations = run_linker(
+            text,
+            command=command,
+            context=context,
+            timeout=timeout,
+        )
+    except (LinkerExecutionError, LinkerParsingError):
+        # Fallback silencioso para apenas regex
+        citations = []
+    return citations, perf_counter() - tl0
+
 
 class CitationDetector:
     """
@@ -34,9 +62,8 @@ class CitationDetector:
         self._use_linker = use_linker
         self._context = context
         self._timeout = timeout
-        self._linker_cmd = (
-            list(linker_cmd) if linker_cmd is not None else list(SETTINGS.linker_cmd)
-        )
+        # None defers to the adapter, which honours SETTINGS.linker_mode
+        self._linker_cmd = list(linker_cmd) if linker_cmd is not None else None
 
     def detect(
         self,
@@ -74,9 +101,19 @@ class CitationDetector:
         resolved_use_linker = self._use_linker if use_linker is None else use_linker
         resolved_context = self._context if context is None else context
         resolved_timeout = self._timeout if timeout is None else timeout
-        resolved_linker_cmd = list(
-            self._linker_cmd if linker_cmd is None else linker_cmd
-        )
+        resolved_linker_cmd = self._linker_cmd if linker_cmd is None else linker_cmd
+
+        if len(text) < SETTINGS.min_detect_chars or text.isspace():
+            # Nothing to find: skip the linker call, the scan and dedup
+            return [], {
+                "duration_linker_s": 0.0,
+                "duration_scanner_s": 0.0,
+                "duration_dedup_s": 0.0,
+                "duration_total_s": 0.0,
+                "num_l1": 0.0,
+                "num_l2": 0.0,
+                "num_final": 0.0,
+            }
 
         t0 = perf_counter()
         logger.info(
@@ -85,27 +122,15 @@ class CitationDetector:
             resolved_context,
         )
 
-        linker_citations: List[CitationSuspect] = []
-        t_linker = 0.0
+        linker_future = None
         if resolved_use_linker:
-            tl0 = perf_counter()
-            try:
-                linker_citations = run_linker(
-                    text,
-                    command=resolved_linker_cmd,
-                    context=resolved_context,
-                    timeout=resolved_timeout,
-                )
-            except (LinkerExecutionError, LinkerParsingError):
-                # Fallback silencioso para apenas regex
-                linker_citations = []
-            finally:
-                t_linker = perf_counter() - tl0
-                logger.info(
-                    "Precision(Linker): %d references in %.3fs",
-                    len(linker_citations),
-                    t_linker,
-                )
+            linker_future = _LINKER_POOL.submit(
+                _timed_linker,
+                text,
+                resolved_linker_cmd,
+                resolved_context,
+                resolved_timeout,
+            )
 
         ts0 = perf_counter()
         regex_citations: List[CitationSuspect] = run_scanner(text)
@@ -116,6 +141,16 @@ class CitationDetector:
             t_scanner,
         )
 
+        linker_citations: List[CitationSuspect] = []
+        t_linker = 0.0
+        if linker_future is not None:
+            linker_citations, t_linker = linker_future.result()
+            logger.info(
+                "Precision(Linker): %d references in %.3fs",
+                len(linker_citations),
+                t_linker,
+            )
+
         td0 = perf_counter()
         final = deduplicate(
             text,
@@ -1,24 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from bisect import bisect_left
+from dataclasses import dataclass, field, replace
+from itertools import accumulate, chain
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Tuple
 
 from lexaudit.config.settings import SETTINGS
 from lexaudit.core.models import CitationSuspect
 
-from .snippets import build_sentence_bounded_range
+from .snippets import BreakIndex, build_sentence_bounded_range
 
+# (start, end, lock_left, lock_right) -> sentence-bounded (left, right)
+_BoundedRange = Callable[[int, int, bool, bool], Tuple[int, int]]
 
-def _overlaps(a: Tuple[int, int], b: Tuple[int, int]) -> bool:
-    """Return True if half-open ranges a and b overlap.
 
-    Ranges are interpreted as [start, end), consistent with Python slicing.
-    """
-    (a0, a1), (b0, b1) = a, b
-    return (a0 < b1) and (b0 < a1)
-
-
-@dataclass
+@dataclass(slots=True)
 class _Cluster:
     """Internal structure to group nearby suspects and compute one snippet.
 
@@ -42,34 +39,31 @@ class _Cluster:
 def _filter_regex_overlapping_linker(
     linkers: List[CitationSuspect], regexes: List[CitationSuspect]
 ) -> List[CitationSuspect]:
-    """Drop regex suspects whose span overlaps any linker span."""
-    linker_spans = [(c.start, c.end) for c in linkers]
+    """
+    Drop regex suspects whose span overlaps any linker span.
+
+    ``linkers`` must be sorted by start (``deduplicate`` passes them sorted);
+    ``regexes`` may come in any order. Each query is a single bisect.
+    """
+    if not linkers:
+        return list(regexes)
+    # A regex span [start, end) overlaps some linker iff, among linkers starting
+    # before ``end``, the furthest-reaching one ends after ``start``.
+    linker_starts = [c.start for c in linkers]
+    reach = list(accumulate((c.end for c in linkers), max))
     kept: List[CitationSuspect] = []
     for c in regexes:
-        span = (c.start, c.end)
-        if not any(_overlaps(span, s) for s in linker_spans):
+        k = bisect_left(linker_starts, c.end)
+        if k == 0 or reach[k - 1] <= c.start:
             kept.append(c)
     return kept
 
 
 def _preliminary_window(
-    text: str,
-    s: CitationSuspect,
-    *,
-    min_chars: int,
-    max_chars: Optional[int],
+    s: CitationSuspect, bounded_range: _BoundedRange
 ) -> Tuple[int, int]:
     """Sentence-aware preliminary window for one suspect span."""
-    left, right = build_sentence_bounded_range(
-        text,
-        s.start,
-        s.end,
-        min_chars=min_chars,
-        max_chars=max_chars,
-        lock_left=False,
-        lock_right=False,
-    )
-    return left, right
+    return bounded_range(s.start, s.end, False, False)
 
 
 def _build_clusters(windows: List[Tuple[int, int, CitationSuspect]]) -> List[_Cluster]:
@@ -78,7 +72,7 @@ def _build_clusters(windows: List[Tuple[int, int, CitationSuspect]]) -> List[_Cl
 
     Args:
         windows: A list of tuples (window_left, window_right, suspect), where window_left and window_right
-                 define the sentence-bounded window for that suspect.
+                 define the sentence-bounded window for that suspect. Sorted in place.
 
     Returns:
         A list of _Cluster objects, each containing suspects whose sentence windows overlap.
@@ -86,9 +80,8 @@ def _build_clusters(windows: List[Tuple[int, int, CitationSuspect]]) -> List[_Cl
     clusters: List[_Cluster] = []
 
     # Sort windows by their starting position, then by end for stable order.
-    for window_left, window_right, suspect in sorted(
-        windows, key=lambda w: (w[0], w[1])
-    ):
+    windows.sort(key=itemgetter(0, 1))
+    for window_left, window_right, suspect in windows:
         # If there are no clusters yet or this window doesn't overlap the last cluster, start a new one.
         if not clusters or window_left > clusters[-1].prelim_right:
             clusters.append(
@@ -111,55 +104,54 @@ def _build_clusters(windows: List[Tuple[int, int, CitationSuspect]]) -> List[_Cl
     return clusters
 
 
-def _has_left_linker_anchor(cl: _Cluster) -> bool:
-    return any(
-        m.detector_type == "linker" and m.start == cl.cov_start for m in cl.members
-    )
-
-
-def _has_right_linker_anchor(cl: _Cluster) -> bool:
-    return any(m.detector_type == "linker" and m.end == cl.cov_end for m in cl.members)
-
-
-def _compute_cluster_snippet_range(
-    text: str,
+def _cluster_stats(cl: _Cluster) -> Tuple[CitationSuspect, bool, bool]:
+    """
+    One pass over ``cl.members`` returning ``(representative, left_anchor,
+    right_anchor)``: the representative is the earliest linker suspect by
+    start/end (else the earliest suspect); the anchors tell whether a linker
+    suspect sits exactly on the coverage start / end.
+    """
+    best_linker: Optional[CitationSuspect] = None
+    best_any: Optional[CitationSuspect] = None
+    left_anchor = right_anchor = False
+    for m in cl.members:
+        if best_any is None or (m.start, m.end) < (best_any.start, best_any.end):
+            best_any = m
+        if m.detector_type == "linker":
+            if best_linker is None or (m.start, m.end) < (
+                best_linker.start,
+                best_linker.end,
+            ):
+                best_linker = m
+            if m.start == cl.cov_start:
+                left_anchor = True
+            if m.end == cl.cov_end:
+                right_anchor = True
+    rep = best_linker if best_linker is not None else best_any
+    return rep, left_anchor, right_anchor  # type: ignore[return-value]
+
+
+def _finalize_cluster(
     cl: _Cluster,
+    bounded_range: _BoundedRange,
     *,
-    min_chars: int,
-    max_chars: Optional[int],
     prefer_linker_edges: bool,
-) -> Tuple[int, int]:
-    """Compute the final snippet range for a cluster, honoring linker anchors."""
-    lock_left = prefer_linker_edges and _has_left_linker_anchor(cl)
-    lock_right = prefer_linker_edges and _has_right_linker_anchor(cl)
-    s_left, s_right = build_sentence_bounded_range(
-        text,
+) -> None:
+    """Set the cluster's snippet range (honoring linker anchors) and representative."""
+    rep, left_anchor, right_anchor = _cluster_stats(cl)
+    cl.snip_start, cl.snip_end = bounded_range(
         cl.cov_start,
         cl.cov_end,
-        min_chars=min_chars,
-        max_chars=max_chars,
-        lock_left=lock_left,
-        lock_right=lock_right,
-    )
-    return s_left, s_right
-
-
-def _choose_representative(cl: _Cluster) -> CitationSuspect:
-    """Prefer a linker suspect; otherwise the earliest by start/end."""
-    linkers = [m for m in cl.members if m.detector_type == "linker"]
-    return (
-        min(linkers, key=lambda m: (m.start, m.end))
-        if linkers
-        else min(cl.members, key=lambda m: (m.start, m.end))
+        prefer_linker_edges and left_anchor,
+        prefer_linker_edges and right_anchor,
     )
+    cl.rep = rep
 
 
 def _reconcile_adjacent_clusters(
     clusters: List[_Cluster],
-    text: str,
+    bounded_range: _BoundedRange,
     *,
-    min_chars: int,
-    max_chars: Optional[int],
     prefer_linker_edges: bool,
 ) -> List[_Cluster]:
     """Ensure no overlap between final snippet ranges; merge if coverage overlaps.
@@ -169,12 +161,15 @@ def _reconcile_adjacent_clusters(
     - Otherwise, trim the left cluster's snip_end so it ends at or before the
       right cluster's snip_start, but never before its coverage end.
     """
-    i = 1
-    while i < len(clusters):
-        prev = clusters[i - 1]
-        curr = clusters[i]
+    if not clusters:
+        return clusters
+    # Single pass: a merged cluster replaces the last kept one and is then
+    # compared with the next cluster, as before, without list splicing
+    result: List[_Cluster] = [clusters[0]]
+    for curr in clusters[1:]:
+        prev = result[-1]
         if prev.snip_end <= curr.snip_start:
-            i += 1
+            result.append(curr)
             continue
         # Coverage overlap → merge clusters
         if prev.cov_end > curr.cov_start:
@@ -185,21 +180,15 @@ def _reconcile_adjacent_clusters(
                 cov_start=min(prev.cov_start, curr.cov_start),
                 cov_end=max(prev.cov_end, curr.cov_end),
             )
-            merged.snip_start, merged.snip_end = _compute_cluster_snippet_range(
-                text,
-                merged,
-                min_chars=min_chars,
-                max_chars=max_chars,
-                prefer_linker_edges=prefer_linker_edges,
+            _finalize_cluster(
+                merged, bounded_range, prefer_linker_edges=prefer_linker_edges
             )
-            merged.rep = _choose_representative(merged)
-            clusters[i - 1 : i + 1] = [merged]
-            # do not increment i; re-check with new neighbor
+            result[-1] = merged
             continue
         # No coverage overlap → trim previous snippet to avoid overlap
         prev.snip_end = max(prev.cov_end, min(prev.snip_end, curr.snip_start))
-        i += 1
-    return clusters
+        result.append(curr)
+    return result
 
 
 def deduplicate(
@@ -232,35 +221,44 @@ def deduplicate(
     regex_sorted = sorted(regex_citations, key=lambda c: (c.start, c.end))
     regex_kept = _filter_regex_overlapping_linker(link_sorted, regex_sorted)
 
+    # Sentence breaks are indexed once and ranges memoized per span: clusters
+    # often recompute the window of a suspect already seen in step 2
+    breaks = BreakIndex(text)
+    range_cache: Dict[Tuple[int, int, bool, bool], Tuple[int, int]] = {}
+
+    def bounded_range(
+        start: int, end: int, lock_left: bool, lock_right: bool
+    ) -> Tuple[int, int]:
+        key = (start, end, lock_left, lock_right)
+        if key not in range_cache:
+            range_cache[key] = build_sentence_bounded_range(
+                text,
+                start,
+                end,
+                min_chars=snippet_min_chars,
+                max_chars=snippet_max_chars,
+                lock_left=lock_left,
+                lock_right=lock_right,
+                breaks=breaks,
+            )
+        return range_cache[key]
+
     # 2) Build preliminary windows
-    windows: List[Tuple[int, int, CitationSuspect]] = []
-    for s in link_sorted + regex_kept:
-        w_left, w_right = _preliminary_window(
-            text, s, min_chars=snippet_min_chars, max_chars=snippet_max_chars
-        )
-        windows.append((w_left, w_right, s))
+    windows: List[Tuple[int, int, CitationSuspect]] = [
+        (*_preliminary_window(s, bounded_range), s)
+        for s in chain(link_sorted, regex_kept)
+    ]
 
     # 3) Cluster by overlapping windows
     clusters = _build_clusters(windows)
 
     # 4) Compute snippet range + representative for each cluster
     for cl in clusters:
-        cl.snip_start, cl.snip_end = _compute_cluster_snippet_range(
-            text,
-            cl,
-            min_chars=snippet_min_chars,
-            max_chars=snippet_max_chars,
-            prefer_linker_edges=prefer_linker_edges,
-        )
-        cl.rep = _choose_representative(cl)
+        _finalize_cluster(cl, bounded_range, prefer_linker_edges=prefer_linker_edges)
 
     # 5) Ensure no overlap among final snippets
     clusters = _reconcile_adjacent_clusters(
-        clusters,
-        text,
-        min_chars=snippet_min_chars,
-        max_chars=snippet_max_chars,
-        prefer_linker_edges=prefer_linker_edges,
+        clusters, bounded_range, prefer_linker_edges=prefer_linker_edges
     )
 
     # Build return: representatives with updated context_snippet
@@ -269,9 +267,10 @@ def deduplicate(
         rep = cl.rep  # type: ignore[assignment]
         if rep is None:
             # Shouldn't happen, but be defensive
-            rep = _choose_representative(cl)
-        rep.context_snippet = text[cl.snip_start : cl.snip_end].strip()
-        final_items.append(rep)
+            rep = _cluster_stats(cl)[0]
+        final_items.append(
+            replace(rep, context_snippet=text[cl.snip_start : cl.snip_end].strip())
+        )
 
     final_items.sort(key=lambda c: (c.start, c.end))
     return final_items
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import html
 import logging
+import os
+import re
+import shlex
 import subprocess
+import threading
+import uuid
 from html.parser import HTMLParser
 from time import perf_counter
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from lexaudit.config.settings import SETTINGS
 from lexaudit.core.models import CitationSuspect, IdentifiedCitation
 
+from .snippets import needle_search_window
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,6 +28,341 @@ class LinkerParsingError(RuntimeError):
     """Error parsing the decorated HTML returned by the Linker."""
 
 
+class LinkerWorkerError(LinkerExecutionError):
+    """The worker session broke (not the linker itself); the exec path still works."""
+
+
+# Pulling the image on first start can take a while; never use linker_timeout here
+_CONTAINER_START_TIMEOUT = 120.0
+
+_container_lock = threading.Lock()
+_container_started = False
+# Only a container this process ran itself is removed again; one that was
+# already running (another process, a manual start) is left alone
+_container_owned = False
+
+
+def _container_state(name: str) -> str:
+    """``docker inspect`` running state: "true", "false", or "" if there is none."""
+    probe = subprocess.run(
+        ["docker", "inspect", "-f", "{{.State.Running}}", name],
+        capture_output=True,
+        text=True,
+        check=False,
+        timeout=_CONTAINER_START_TIMEOUT,
+    )
+    return probe.stdout.strip()
+
+
+def _ensure_linker_container() -> str:
+    """
+    Start the long-lived linker container once per process and return its name.
+
+    Several processes may get here at the same time (``process_batch`` worker
+    processes), so a running container is never removed: a losing
+    ``docker run`` is treated as "started by someone else" and reused.
+    """
+    global _container_started, _container_owned
+    name = SETTINGS.linker_container_name
+    with _container_lock:
+        if _container_started:
+            return name
+        try:
+            state = _container_state(name)
+            if state != "true":
+                if state == "false":
+                    # Drop a stopped leftover with the same name; without -f,
+                    # docker refuses if another process has just started it
+                    subprocess.run(
+                        ["docker", "rm", name],
+                        capture_output=True,
+                        check=False,
+                        timeout=_CONTAINER_START_TIMEOUT,
+                    )
+                started = subprocess.run(
+                    [
+                        "docker",
+                        "run",
+                        "-d",
+                        "--rm",
+                        "--name",
+                        name,
+                        "--entrypoint",
+                        "/bin/sh",
+                        SETTINGS.linker_image,
+                        "-c",
+                        "while sleep 3600; do :; done",
+                    ],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                    timeout=_CONTAINER_START_TIMEOUT,
+                )
+                if started.returncode == 0:
+                    logger.info("Linker container '%s' started", name)
+                    _container_owned = True
+                elif _container_state(name) == "true":
+                    # Name conflict: another process won the race, use its one
+                    logger.info("Linker container '%s' reused", name)
+                else:
+                    raise LinkerExecutionError(
+                        f"Could not start linker container: {started.stderr.strip()}"
+                    )
+        except FileNotFoundError as exc:
+            raise LinkerExecutionError("Linker command not found: docker") from exc
+        except subprocess.TimeoutExpired as exc:
+            raise LinkerExecutionError("Linker container start timed out") from exc
+        _container_started = True
+    return name
+
+
+def stop_linker_container() -> None:
+    """Remove the persistent linker container if this process started it."""
+    global _container_started, _container_owned
+    _close_linker_workers()
+    with _container_lock:
+        owned = _container_owned
+        _container_started = _container_owned = False
+        if not owned:
+            return
+        name = SETTINGS.linker_container_name
+        try:
+            subprocess.run(
+                ["docker", "rm", "-f", name],
+                capture_output=True,
+                check=False,
+                timeout=_CONTAINER_START_TIMEOUT,
+            )
+            logger.info("Linker container '%s' removed", name)
+        except (FileNotFoundError, subprocess.TimeoutExpired) as exc:
+            logger.warning("Could not remove linker container '%s': %s", name, exc)
+
+
+def start_linker_container() -> bool:
+    """
+    Start the persistent linker container up front, e.g. before worker
+    processes are created so they reuse one container instead of racing to
+    start their own. Returns True if this call started it, in which case the
+    caller should ``stop_linker_container()`` once done.
+    """
+    if SETTINGS.linker_mode != "persistent":
+        return False
+    already_started = _container_started
+    try:
+        _ensure_linker_container()
+    except LinkerExecutionError as exc:
+        # Each process retries on its own; detection falls back to the scanner
+        logger.warning("Could not start linker container: %s", exc)
+        return False
+    return not already_started and _container_owned
+
+
+def _default_linker_command() -> List[str]:
+    if SETTINGS.linker_mode == "persistent":
+        name = _ensure_linker_container()
+        return ["docker", "exec", "-i", name, SETTINGS.linker_binary]
+    return list(SETTINGS.linker_cmd)
+
+
+# Runs inside the linker container: reads "<nbytes>\n" + document frames from
+# stdin, runs the linker on each and answers "<exit> <nbytes>\n" + output.
+# {tag} is unique per worker so a timed-out session can be found and killed.
+_WORKER_SHIM = (
+    "out=/tmp/lexaudit_linker.{tag}; trap 'rm -f \"$out\"' EXIT;"
+    ' while IFS= read -r n; do head -c "$n" | {linker}'
+    ' >"$out" 2>/dev/null; echo "$? $(wc -c <"$out")"; cat "$out"; done'
+)
+
+# Killing the local ``docker exec`` client leaves its session running inside
+# the container; this kills the shim and its children and drops its output
+# file. "[.]" keeps pgrep from matching this command's own shell.
+_WORKER_KILL = (
+    "for p in $(pgrep -f 'lexaudit_linker[.]{tag}'); do pkill -P \"$p\";"
+    ' kill "$p"; done; rm -f /tmp/lexaudit_linker[.]{tag}'
+)
+
+
+class LinkerWorker:
+    """
+    One long-lived ``docker exec`` session that serves document after
+    document, so the exec round-trip is paid once instead of per call. Calls
+    on one worker are serialised; concurrency comes from keeping several.
+    """
+
+    def __init__(
+        self, command: Sequence[str], kill_command: Optional[Sequence[str]] = None
+    ):
+        self._command = list(command)
+        self._kill_command = list(kill_command) if kill_command else None
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def _start(self) -> subprocess.Popen:
+        self._proc = subprocess.Popen(
+            self._command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        return self._proc
+
+    def process(self, text: str, timeout: Optional[float] = None) -> str:
+        payload = text.encode("utf-8")
+        with self._lock:
+            proc = self._proc
+            if proc is None or proc.poll() is not None:
+                proc = self._start()
+            timed_out = threading.Event()
+
+            def _kill() -> None:
+                timed_out.set()
+                proc.kill()
+
+            timer = threading.Timer(timeout, _kill) if timeout else None
+            if timer is not None:
+                timer.start()
+            try:
+                proc.stdin.write(b"%d\n" % len(payload) + payload)
+                proc.stdin.flush()
+                header = proc.stdout.readline().split()
+                returncode, size = int(header[0]), int(header[1])
+                output = proc.stdout.read(size)
+                if len(output) != size:
+                    raise ValueError("short read")
+            except (OSError, ValueError, IndexError) as exc:
+                self._close()
+                if timed_out.is_set():
+                    self._kill_session(timeout)
+                    raise LinkerExecutionError("Linker command timed out") from exc
+                raise LinkerWorkerError(f"Linker worker failed: {exc!r}") from exc
+            finally:
+                if timer is not None:
+                    timer.cancel()
+        if returncode == 127:
+            # The shell could not find head/wc/the linker itself
+            self.close()
+            raise LinkerWorkerError("Linker worker shim: command not found")
+        if returncode != 0:
+            raise LinkerExecutionError(f"Linker exited with code {returncode}")
+        return output.decode("utf-8")
+
+    def _kill_session(self, timeout: Optional[float]) -> None:
+        """Best effort: stop what the timed-out session left in the container."""
+        if self._kill_command is None:
+            return
+        try:
+            subprocess.run(
+                self._kill_command,
+                capture_output=True,
+                check=False,
+                timeout=timeout,
+            )
+        except (OSError, subprocess.TimeoutExpired) as exc:
+            logger.warning("Could not kill timed-out linker session: %s", exc)
+
+    def _close(self) -> None:
+        if self._proc is None:
+            return
+        if self._proc.poll() is None:
+            self._proc.kill()
+        self._proc.wait()
+        for stream in (self._proc.stdin, self._proc.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        self._proc = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+
+# Up to SETTINGS.linker_max_parallel workers per (output format, context), so
+# that many documents can be linked at once; idle ones are handed out first
+_workers_cond = threading.Condition()
+_workers: Dict[Tuple[str, str], List[LinkerWorker]] = {}
+_idle_workers: Dict[Tuple[str, str], List[LinkerWorker]] = {}
+_workers_disabled = False
+
+
+def _acquire_linker_worker(output_format: str, context: str) -> Optional[LinkerWorker]:
+    """
+    Reserve a worker for the persistent container, or None when workers
+    cannot be used. Blocks while all workers of the key are busy; give it back
+    with ``_release_linker_worker``.
+    """
+    if SETTINGS.linker_mode != "persistent" or _workers_disabled:
+        return None
+    # Starting the container may take a while: do it before taking the
+    # condition, which every other linker call needs to acquire or release
+    name = _ensure_linker_container()
+    linker = shlex.join(
+        _build_linker_args(
+            command=[SETTINGS.linker_binary],
+            output_format=output_format,
+            context=context,
+        )
+    )
+    key = (output_format, context)
+    with _workers_cond:
+        while not _workers_disabled:
+            idle = _idle_workers.setdefault(key, [])
+            if idle:
+                return idle.pop()
+            started = _workers.setdefault(key, [])
+            if len(started) < max(1, SETTINGS.linker_max_parallel):
+                tag = uuid.uuid4().hex
+                worker = LinkerWorker(
+                    ["docker", "exec", "-i", name, "/bin/sh", "-c"]
+                    + [_WORKER_SHIM.format(tag=tag, linker=linker)],
+                    kill_command=["docker", "exec", name, "/bin/sh", "-c"]
+                    + [_WORKER_KILL.format(tag=tag)],
+                )
+                started.append(worker)
+                return worker
+            _workers_cond.wait()
+    return None
+
+
+def _release_linker_worker(
+    output_format: str, context: str, worker: LinkerWorker
+) -> None:
+    key = (output_format, context)
+    with _workers_cond:
+        # Workers closed in the meantime are not handed out again
+        if worker in _workers.get(key, ()):
+            _idle_workers.setdefault(key, []).append(worker)
+        _workers_cond.notify()
+
+
+def _close_linker_workers() -> None:
+    with _workers_cond:
+        for workers in _workers.values():
+            for worker in workers:
+                worker.close()
+        _workers.clear()
+        _idle_workers.clear()
+        _workers_cond.notify_all()
+
+
+def _reset_after_fork() -> None:
+    """
+    A forked child (process_batch worker) must not use or kill the parent's
+    worker sessions, nor remove the parent's container on shutdown.
+    """
+    global _container_lock, _container_owned, _workers_cond
+    global _workers, _idle_workers
+    _container_lock = threading.Lock()
+    _container_owned = False
+    _workers_cond = threading.Condition()
+    _workers = {}
+    _idle_workers = {}
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
 def _build_linker_args(
     *,
     command: Optional[Sequence[str]] = None,
@@ -30,7 +373,7 @@ def _build_linker_args(
     flag = {"html": "--html", "xml": "--xml"}.get(output_format.lower())
     if flag is None:
         raise ValueError(f"Unsupported linker output format: {output_format}")
-    args = list(command) if command is not None else list(SETTINGS.linker_cmd)
+    args = list(command) if command is not None else _default_linker_command()
     args = args + ["--text", flag, f"--contexto={context}"]
     if extra_args:
         args.extend(extra_args)
@@ -45,8 +388,27 @@ def _run_linker(
     context: str = SETTINGS.linker_context,
     timeout: Optional[float] = SETTINGS.linker_timeout,
 ) -> str:
+    global _workers_disabled
     if not isinstance(text, str):
         raise TypeError("text must be a string")
+    worker = _acquire_linker_worker(output_format, context) if command is None else None
+    if worker is not None:
+        try:
+            t0 = perf_counter()
+            decorated = worker.process(text, timeout)
+            logger.debug(
+                "Linker (worker) concluído em %.3fs (bytes=%d)",
+                perf_counter() - t0,
+                len(decorated),
+            )
+            return decorated
+        except LinkerWorkerError as exc:
+            # e.g. an image without head/wc: stay on one exec per document
+            logger.warning("Linker worker unavailable, using docker exec: %s", exc)
+            _workers_disabled = True
+            _close_linker_workers()
+        finally:
+            _release_linker_worker(output_format, context, worker)
     args = _build_linker_args(
         command=command,
         output_format=output_format,
@@ -95,34 +457,36 @@ class _LinkerHTMLParser(HTMLParser):
         super().__init__(convert_charrefs=True)
         self._original = original_text
         self._cursor = 0
-        self._anchor_stack: List[Dict[str, Any]] = []
+        # Open anchors as parallel stacks: first data start / last data end
+        # (None until the anchor receives text)
+        self._anchor_open_start: List[Optional[int]] = []
+        self._anchor_last_end: List[Optional[int]] = []
         self.references: List[Tuple[int, int]] = []
 
     def handle_starttag(self, tag: str, attrs_list):
         if tag.lower() != "a":
             return
-        attrs = dict(attrs_list)
-        if not _has_linker_class(attrs):
+        if not _has_linker_class(dict(attrs_list)):
             return
-        self._anchor_stack.append({"attrs": attrs, "segments": []})
+        self._anchor_open_start.append(None)
+        self._anchor_last_end.append(None)
 
     def handle_data(self, data: str):
         if not data:
             return
         start = self._align_to_original(data)
-        end = start + len(data)
-        if self._anchor_stack:
-            self._anchor_stack[-1]["segments"].append((start, end))
+        if self._anchor_open_start:
+            if self._anchor_open_start[-1] is None:
+                self._anchor_open_start[-1] = start
+            self._anchor_last_end[-1] = start + len(data)
 
     def handle_endtag(self, tag: str):
-        if tag.lower() != "a" or not self._anchor_stack:
+        if tag.lower() != "a" or not self._anchor_open_start:
             return
-        anchor = self._anchor_stack.pop()
-        segments = anchor["segments"]
-        if not segments:
+        start = self._anchor_open_start.pop()
+        end = self._anchor_last_end.pop()
+        if start is None:
             return
-        start = segments[0][0]
-        end = segments[-1][1]
         self.references.append((start, end))
 
     def close(self):
@@ -132,7 +496,7 @@ class _LinkerHTMLParser(HTMLParser):
                 "Decorated output diverges from original text; cannot map spans."
             )
         # We don't require _cursor == len(original); the Linker may not wrap the final
-        if self._anchor_stack:
+        if self._anchor_open_start:
             raise LinkerParsingError("Unbalanced <a> tags in Linker output")
 
     def _align_to_original(self, data: str) -> int:
@@ -151,6 +515,82 @@ class _LinkerHTMLParser(HTMLParser):
         return start
 
 
+_ANCHOR_RE = re.compile(r"<a\b([^>]*)>(.*?)</a\s*>", re.DOTALL | re.IGNORECASE)
+# One class attribute: double-quoted, single-quoted or unquoted value
+_CLASS_ATTR_RE = re.compile(
+    r"""(?:^|\s)class\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.IGNORECASE
+)
+_TAG_RE = re.compile(r"<[^>]*>")
+
+
+def _is_linker_anchor(attrs: str) -> bool:
+    """
+    Same answer as ``_has_linker_class`` on the parsed attributes of an
+    ``<a ...>`` tag. Raises LinkerParsingError (parser fallback) when the
+    attributes could hide or repeat the class: character references, several
+    class attributes, or the marker outside a class attribute we can read.
+    """
+    if "&" in attrs:
+        raise LinkerParsingError("Character reference in anchor attributes")
+    if "lexmlurnlink" not in attrs.lower():
+        return False
+    values = _CLASS_ATTR_RE.findall(attrs)
+    if len(values) != 1:
+        raise LinkerParsingError("Cannot read anchor class")
+    return _has_linker_class({"class": "".join(values[0])})
+
+
+def _anchor_spans(original: str, decorated: str) -> Optional[List[Tuple[int, int]]]:
+    """
+    Fast path for _LinkerHTMLParser: walk the lexmlurnlink anchors with one
+    regex and align the text around them with a forward-moving cursor.
+
+    Returns None whenever the output leaves the plain "escaped text + flat
+    anchors" shape (nested anchors, tags inside an anchor, a segment that does
+    not align), so the caller can fall back to the HTML parser.
+    """
+    spans: List[Tuple[int, int]] = []
+    cursor = 0
+
+    def _align(segment: str) -> int:
+        nonlocal cursor
+        if "<" in segment:
+            raise LinkerParsingError("Unexpected markup in anchor")
+        data = html.unescape(segment)
+        idx = (
+            cursor if original.startswith(data, cursor) else original.find(data, cursor)
+        )
+        if idx == -1:
+            raise LinkerParsingError("Could not align decorated segment")
+        cursor = idx + len(data)
+        return idx
+
+    def _skip(gap: str) -> None:
+        if "lexmlurnlink" in gap.lower():
+            raise LinkerParsingError("Unmatched linker anchor")
+        for piece in _TAG_RE.split(gap):
+            if piece:
+                _align(piece)
+
+    last = 0
+    try:
+        for m in _ANCHOR_RE.finditer(decorated):
+            _skip(decorated[last : m.start()])
+            last = m.end()
+            inner = m.group(2)
+            if not inner:
+                continue
+            if not _is_linker_anchor(m.group(1)):
+                _align(inner)
+                continue
+            start = _align(inner)
+            spans.append((start, cursor))
+        _skip(decorated[last:])
+    except LinkerParsingError:
+        return None
+    return spans
+
+
 def run_linker(
     text: str,
     *,
@@ -171,13 +611,27 @@ def run_linker(
         context=context,
         timeout=timeout,
     )
-    parser = _LinkerHTMLParser(text)
-    parser.feed(decorated)
-    parser.close()
+    references = _anchor_spans(text, decorated)
+    if references is None:
+        parser = _LinkerHTMLParser(text)
+        parser.feed(decorated)
+        parser.close()
+        references = parser.references
     citations: List[CitationSuspect] = []
-    for start, end in parser.references:
+    # IdentifiedCitation is frozen, so repeated anchor texts share one instance
+    identified: Dict[str, IdentifiedCitation] = {}
+    for start, end in references:
         snippet = ""
         suspect_text = text[start:end]
+        identification = identified.get(suspect_text)
+        if identification is None:
+            identification = identified[suspect_text] = IdentifiedCitation(
+                identified_string=suspect_text,
+                formatted_name=suspect_text,
+                citation_type="unknown",
+                confidence=1.0,
+                justification="linker",
+            )
         citations.append(
             CitationSuspect(
                 suspect_string=suspect_text,
@@ -185,18 +639,23 @@ def run_linker(
                 start=start,
                 end=end,
                 detector_type="linker",
+                search_window=needle_search_window(
+                    text, start, end, suspect_text.strip()
+                ),
                 identified_citations=[  # List of identified citations that match this suspect
-                    IdentifiedCitation(
-                        identified_string=suspect_text,
-                        formatted_name=suspect_text,
-                        citation_type="unknown",
-                        confidence=1.0,
-                        justification="linker",
-                    )
+                    identification
                 ],
             )
         )
     return citations
 
 
-__all__ = ["run_linker", "LinkerExecutionError", "LinkerParsingError"]
+__all__ = [
+    "run_linker",
+    "start_linker_container",
+    "stop_linker_container",
+    "LinkerWorker",
+    "LinkerExecutionError",
+    "LinkerWorkerError",
+    "LinkerParsingError",
+]
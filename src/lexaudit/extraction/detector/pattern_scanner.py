@@ -1,35 +1,94 @@
 from __future__ import annotations
 
-from typing import List
+import re
+from typing import Iterator, List
 
 from lexaudit.core.models import CitationSuspect
 
-from .regexes import LEXML_REFERENCE_REGEX
+from .regexes import get_hyperscan_db, get_reference_prefilter, get_reference_regex
+from .snippets import needle_search_window
+
+
+def _may_contain_reference(db, text: str) -> bool:
+    """Hyperscan prefilter: False means no pattern can match anywhere in ``text``."""
+    hits: List[int] = []
+
+    def _on_match(pattern_id, start, end, flags, context):
+        hits.append(pattern_id)
+
+    db.scan(text.encode("utf-8"), match_event_handler=_on_match)
+    return bool(hits)
+
+
+def _next_start(pattern, text: str, pos: int) -> int:
+    if pattern is None:
+        return len(text) + 1
+    m = pattern.search(text, pos)
+    return m.start() if m else len(text) + 1
+
+
+def _iter_reference_matches(text: str) -> Iterator[re.Match[str]]:
+    """
+    Same matches as ``LEXML_REFERENCE_REGEX.finditer(text)``, but the unified
+    regex is only tried at offsets where some pattern can start: a literal
+    anchor or an unanchored pattern's match. Both lookups are cached until the
+    scan moves past them.
+    """
+    reference_regex, _ = get_reference_regex()
+    anchor_regex, unanchored_regex = get_reference_prefilter()
+    n = len(text)
+    pos = 0
+    next_anchor = next_unanchored = -1
+    while pos <= n:
+        if next_anchor < pos:
+            next_anchor = _next_start(anchor_regex, text, pos)
+        if next_unanchored < pos:
+            next_unanchored = _next_start(unanchored_regex, text, pos)
+        candidate = min(next_anchor, next_unanchored)
+        if candidate > n:
+            return
+        m = reference_regex.match(text, candidate)
+        if m is None:
+            pos = candidate + 1
+            continue
+        yield m
+        pos = m.end() if m.end() > candidate else candidate + 1
 
 
 def run_scanner(text: str) -> List[CitationSuspect]:
     """
     Scanner based on regex (Coverage), equivalent to the behavior of version 2.
     - Uses the unified regex compiled from fragments (strict + loose).
-    - Maintains the same iteration logic (finditer) of v2.
+    - Yields the same matches as v2's finditer, trying the regex only at
+      offsets where some pattern can start.
     - Returns Citation objects with detector="regex".
     """
     if not isinstance(text, str):
         raise TypeError("text must be a string")
 
+    # One SIMD pass rules out texts with no candidate at all
+    hyperscan_db = get_hyperscan_db()
+    if hyperscan_db is not None and not _may_contain_reference(hyperscan_db, text):
+        return []
+
+    # Matches come out in increasing, non-overlapping order: already sorted by
+    # (start, end), so no sort pass is needed
     citations: List[CitationSuspect] = []
-    for m in LEXML_REFERENCE_REGEX.finditer(text):
+    for m in _iter_reference_matches(text):
+        start, end = m.span()
+        suspect_string = m.group(0)
         citations.append(
             CitationSuspect(
-                suspect_string=m.group(0),
+                suspect_string=suspect_string,
                 context_snippet="",
-                start=m.start(),
-                end=m.end(),
+                start=start,
+                end=end,
                 detector_type="regex",
+                search_window=needle_search_window(
+                    text, start, end, suspect_string.strip()
+                ),
             )
         )
-    # Sort by start for stability
-    citations.sort(key=lambda c: (c.start, c.end))
     return citations
 
 
@@ -1,19 +1,43 @@
 from __future__ import annotations
 
+from typing import Any
+
+from . import compile as _compile
 from .compile import (
     COMMON_REGEX_FLAGS,
-    GROUP_METADATA,
-    LEXML_REFERENCE_REGEX,
-    REFERENCE_GROUP_METADATA,
     REFERENCE_PATTERN_SPECS,
-    REFERENCE_REGEX,
+    REFERENCE_PATTERN_SPECS_FLAT,
+    build_hyperscan_db,
+    build_reference_prefilter,
+    get_hyperscan_db,
+    get_reference_prefilter,
+    get_reference_regex,
+    literal_anchors,
 )
 
+
+def __getattr__(name: str) -> Any:
+    # Compiled regexes / databases are built lazily by .compile
+    if name in _compile._LAZY_ATTRIBUTES:
+        return getattr(_compile, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "COMMON_REGEX_FLAGS",
     "REFERENCE_PATTERN_SPECS",
+    "REFERENCE_PATTERN_SPECS_FLAT",
     "REFERENCE_REGEX",
     "REFERENCE_GROUP_METADATA",
+    "REFERENCE_HYPERSCAN_DB",
+    "REFERENCE_ANCHOR_REGEX",
+    "REFERENCE_UNANCHORED_REGEX",
     "LEXML_REFERENCE_REGEX",
     "GROUP_METADATA",
+    "build_hyperscan_db",
+    "build_reference_prefilter",
+    "get_hyperscan_db",
+    "get_reference_prefilter",
+    "get_reference_regex",
+    "literal_anchors",
 ]
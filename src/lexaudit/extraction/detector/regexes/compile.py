@@ -1,7 +1,19 @@
 from __future__ import annotations
 
+import functools
+import logging
 import re
-from typing import Dict, List, Mapping, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+try:  # Python >= 3.11
+    from re import _parser as _sre_parse
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_parse as _sre_parse
+
+try:  # optional: SIMD multi-pattern prefilter for the scanner
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 from .common import COMMON_REGEX_FLAGS
 from .loose import (  # CONSTITUTION_PATTERN, Is also in strict
@@ -62,6 +74,8 @@ from .strict import (
     URN_LEXML_PATTERN,
 )
 
+logger = logging.getLogger(__name__)
+
 # Mapeamento de chaves → padrões, idêntico ao de versao2/patterns.py
 REFERENCE_PATTERN_SPECS: Dict[str, str] = {
     "constitution": CONSTITUTION_PATTERN,
@@ -119,9 +133,57 @@ REFERENCE_PATTERN_SPECS: Dict[str, str] = {
     "article_list": ARTICLE_LIST_PATTERN,
 }
 
+# Characters re.VERBOSE ignores outside character classes
+_VERBOSE_WHITESPACE = frozenset(" \t\n\r\v\f")
+
+
+def _strip_verbose(pattern: str) -> str:
+    """
+    ``pattern`` (written for re.VERBOSE) without the whitespace and ``#``
+    comments VERBOSE ignores, so it means the same when compiled without the
+    flag. Escapes and character classes are copied untouched.
+    """
+    out: List[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "\\":
+            out.append(pattern[i : i + 2])
+            i += 2
+        elif c == "[":
+            # Copy the class up to its closing "]"; a "]" right after "[" or
+            # "[^" is a literal member
+            j = i + 1
+            if pattern.startswith("^", j):
+                j += 1
+            if pattern.startswith("]", j):
+                j += 1
+            while j < n and pattern[j] != "]":
+                j += 2 if pattern[j] == "\\" else 1
+            out.append(pattern[i : j + 1])
+            i = j + 1
+        elif c in _VERBOSE_WHITESPACE:
+            i += 1
+        elif c == "#":
+            newline = pattern.find("\n", i)
+            i = n if newline == -1 else newline + 1
+        else:
+            out.append(c)
+            i += 1
+    return "".join(out)
+
+
+# Same patterns with the VERBOSE layout stripped once. The unified regex
+# compiles these without re.VERBOSE; they also read the same under it, so
+# the Hyperscan database (which keeps "(?x)") takes them too
+REFERENCE_PATTERN_SPECS_FLAT: Dict[str, str] = {
+    label: _strip_verbose(pattern) for label, pattern in REFERENCE_PATTERN_SPECS.items()
+}
+
 
 def _compile_pattern_groups(
     groups: Mapping[str, Dict[str, str]],
+    flags: int = COMMON_REGEX_FLAGS,
 ) -> Tuple[re.Pattern[str], Dict[str, Dict[str, str]]]:
     pattern_fragments: List[str] = []
     metadata: Dict[str, Dict[str, str]] = {}
@@ -133,25 +195,256 @@ def _compile_pattern_groups(
             metadata[group_name] = {"category": label, "confidence": confidence}
 
     combined_pattern = re.compile(
-        "|\n".join(pattern_fragments),
-        flags=COMMON_REGEX_FLAGS,
+        "|".join(pattern_fragments),
+        flags=flags,
     )
     return combined_pattern, metadata
 
 
-REFERENCE_REGEX, REFERENCE_GROUP_METADATA = _compile_pattern_groups(
-    {"reference": REFERENCE_PATTERN_SPECS}
-)
+@functools.cache
+def get_reference_regex() -> Tuple[re.Pattern[str], Dict[str, Dict[str, str]]]:
+    """Unified reference regex and its group metadata, compiled on first use."""
+    return _compile_pattern_groups(
+        {"reference": REFERENCE_PATTERN_SPECS_FLAT},
+        flags=COMMON_REGEX_FLAGS & ~re.VERBOSE,
+    )
+
+
+# Larger prefix sets are truncated to what is known so far
+_MAX_PREFIXES = 64
+
+
+def _item_prefixes(op, av) -> Set[Tuple[str, bool]]:
+    """(prefix, complete) pairs for one parsed regex item; see _seq_prefixes."""
+    if op in (_sre_parse.AT, _sre_parse.ASSERT, _sre_parse.ASSERT_NOT):
+        return {("", True)}  # zero-width
+    if op is _sre_parse.LITERAL:
+        return {(chr(av), True)}
+    if op is _sre_parse.IN:
+        chars: Set[str] = set()
+        for item_op, item_av in av:
+            if item_op is _sre_parse.LITERAL:
+                chars.add(chr(item_av))
+            elif item_op is _sre_parse.RANGE and item_av[1] - item_av[0] < 16:
+                chars.update(map(chr, range(item_av[0], item_av[1] + 1)))
+            else:
+                return {("", False)}
+        return {(c, True) for c in chars}
+    if op is _sre_parse.SUBPATTERN:
+        return _seq_prefixes(av[-1])
+    if op is _sre_parse.BRANCH:
+        return set().union(*(_seq_prefixes(branch) for branch in av[1]))
+    if op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT):
+        low, high, sub = av
+        once = _seq_prefixes(sub)
+        if high != 1:
+            once = {(prefix, False) for prefix, _ in once}
+        if low == 0:
+            once.add(("", True))
+        return once
+    return {("", False)}
+
+
+def _seq_prefixes(items) -> Set[Tuple[str, bool]]:
+    """
+    Literal prefixes every match of a parsed sequence starts with, as
+    (prefix, complete) pairs; ``complete`` means the prefix is the whole match
+    so following items may extend it.
+    """
+    results = {("", True)}
+    for op, av in items:
+        if not any(complete for _, complete in results):
+            break
+        item = _item_prefixes(op, av)
+        extended: Set[Tuple[str, bool]] = set()
+        for prefix, complete in results:
+            if complete:
+                extended.update((prefix + p, c) for p, c in item)
+            else:
+                extended.add((prefix, False))
+        if len(extended) > _MAX_PREFIXES:
+            return {(prefix, False) for prefix, _ in results}
+        results = extended
+    return results
+
+
+def literal_anchors(pattern: str, flags: int = COMMON_REGEX_FLAGS) -> Set[str]:
+    """
+    Lowercased literals one of which starts every match of ``pattern``;
+    empty when some match may start with anything (no usable anchor).
+    """
+    prefixes = {p for p, _ in _seq_prefixes(_sre_parse.parse(pattern, flags))}
+    if "" in prefixes:
+        return set()
+    return {p.lower() for p in prefixes}
+
+
+def _trie_pattern(words: Set[str]) -> str:
+    """Regex matching any of ``words``, factored as a trie of common prefixes."""
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def _build(node: Dict[str, dict]) -> str:
+        optional = "" in node
+        leaves = []
+        branches = []
+        for ch in sorted(k for k in node if k):
+            rest = _build(node[ch])
+            if rest:
+                branches.append(re.escape(ch) + rest)
+            else:
+                leaves.append(re.escape(ch))
+        if len(leaves) == 1:
+            branches.append(leaves[0])
+        elif leaves:
+            branches.append("[" + "".join(leaves) + "]")
+        if not branches:
+            return ""
+        body = "(?:" + "|".join(branches) + ")"
+        return body + "?" if optional else body
+
+    return _build(trie)
+
+
+def build_reference_prefilter(
+    specs: Mapping[str, str] = REFERENCE_PATTERN_SPECS,
+) -> Tuple[Optional[re.Pattern[str]], Optional[re.Pattern[str]]]:
+    """
+    Regexes locating every offset where some pattern in ``specs`` may match.
+
+    Returns ``(anchor_regex, unanchored_regex)``: the first finds the literal
+    anchors of the anchored patterns (one trie-shaped alternation, so a single
+    pass instead of one branch per pattern per offset); the second is the
+    alternation of patterns without an anchor. Either may be None.
+    """
+    anchors: Set[str] = set()
+    unanchored: List[str] = []
+    for pattern in specs.values():
+        pattern_anchors = literal_anchors(pattern)
+        if pattern_anchors:
+            anchors |= pattern_anchors
+        else:
+            unanchored.append(pattern)
+    # A match of "artigo" always starts with a match of "art"
+    anchors = {
+        a for a in anchors if not any(b != a and a.startswith(b) for b in anchors)
+    }
+    anchor_regex = (
+        re.compile(_trie_pattern(anchors), re.IGNORECASE | re.UNICODE)
+        if anchors
+        else None
+    )
+    unanchored_regex = (
+        re.compile("|".join(f"(?:{p})" for p in unanchored), COMMON_REGEX_FLAGS)
+        if unanchored
+        else None
+    )
+    return anchor_regex, unanchored_regex
+
+
+@functools.cache
+def get_reference_prefilter() -> Tuple[
+    Optional[re.Pattern[str]], Optional[re.Pattern[str]]
+]:
+    """``build_reference_prefilter()`` for the reference specs, built on first use."""
+    return build_reference_prefilter()
+
+
+def build_hyperscan_db(
+    specs: Mapping[str, str] = REFERENCE_PATTERN_SPECS_FLAT,
+) -> Optional[Any]:
+    """
+    Compile ``specs`` into a Hyperscan block-mode database, or return None.
+
+    Patterns use lookarounds, which Hyperscan cannot match exactly, so they are
+    compiled in prefilter mode: the database may report matches ``re`` would
+    reject, but never misses one. It can therefore only rule texts out; the
+    spans themselves still come from ``REFERENCE_REGEX``.
+    """
+    if hyperscan is None:
+        return None
+    flags = (
+        hyperscan.HS_FLAG_CASELESS
+        | hyperscan.HS_FLAG_MULTILINE
+        | hyperscan.HS_FLAG_UTF8
+        | hyperscan.HS_FLAG_UCP
+        | hyperscan.HS_FLAG_PREFILTER
+        | hyperscan.HS_FLAG_SINGLEMATCH
+    )
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        db.compile(
+            expressions=[f"(?x){p}".encode("utf-8") for p in specs.values()],
+            ids=list(range(len(specs))),
+            flags=[flags] * len(specs),
+        )
+    except Exception as exc:  # unsupported construct: keep the re-only path
+        logger.warning("Hyperscan prefilter disabled: %s", exc)
+        return None
+    return db
+
+
+@functools.cache
+def get_hyperscan_db() -> Optional[Any]:
+    """
+    ``build_hyperscan_db()`` for the reference specs, built on first use. None
+    when hyperscan is not installed (or cannot compile the patterns).
+    """
+    return build_hyperscan_db()
+
+
+# The compiled objects are only built when first needed (importing the
+# package, e.g. for linker-only runs, does not pay for them); the module-level
+# names are kept and resolve through __getattr__
+_LAZY_ATTRIBUTES = {
+    "REFERENCE_REGEX": lambda: get_reference_regex()[0],
+    "REFERENCE_GROUP_METADATA": lambda: get_reference_regex()[1],
+    "REFERENCE_ANCHOR_REGEX": lambda: get_reference_prefilter()[0],
+    "REFERENCE_UNANCHORED_REGEX": lambda: get_reference_prefilter()[1],
+    "REFERENCE_HYPERSCAN_DB": get_hyperscan_db,
+    # Aliases de compatibilidade com a versão 2
+    "LEXML_REFERENCE_REGEX": lambda: get_reference_regex()[0],
+    "GROUP_METADATA": lambda: get_reference_regex()[1],
+}
+
+
+# Declared (not assigned) so the names stay visible to readers and linters
+REFERENCE_REGEX: re.Pattern[str]
+REFERENCE_GROUP_METADATA: Dict[str, Dict[str, str]]
+REFERENCE_ANCHOR_REGEX: Optional[re.Pattern[str]]
+REFERENCE_UNANCHORED_REGEX: Optional[re.Pattern[str]]
+REFERENCE_HYPERSCAN_DB: Optional[Any]
+LEXML_REFERENCE_REGEX: re.Pattern[str]
+GROUP_METADATA: Dict[str, Dict[str, str]]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        factory = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return factory()
 
-# Aliases de compatibilidade com a versão 2
-LEXML_REFERENCE_REGEX = REFERENCE_REGEX
-GROUP_METADATA = REFERENCE_GROUP_METADATA
 
 __all__ = [
     "COMMON_REGEX_FLAGS",
     "REFERENCE_PATTERN_SPECS",
+    "REFERENCE_PATTERN_SPECS_FLAT",
     "REFERENCE_REGEX",
     "REFERENCE_GROUP_METADATA",
+    "REFERENCE_HYPERSCAN_DB",
+    "REFERENCE_ANCHOR_REGEX",
+    "REFERENCE_UNANCHORED_REGEX",
     "LEXML_REFERENCE_REGEX",
     "GROUP_METADATA",
+    "build_hyperscan_db",
+    "build_reference_prefilter",
+    "get_hyperscan_db",
+    "get_reference_prefilter",
+    "get_reference_regex",
+    "literal_anchors",
 ]
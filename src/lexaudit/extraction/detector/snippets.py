@@ -1,31 +1,31 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple
-
-_HARD_PUNCT = {".", "!", "?"}
-_SOFT_PUNCT = {";", ":"}
-_ABBREVIATIONS = {
-    # Common legal abbreviations in PT-BR that end with dot and should not split sentences
-    "art.",
-    "arts.",
-    "inc.",
-    "incs.",
-    "al.",
-    "n.",
-    "nº",
-    "no.",
-    "vol.",
-    "v.",
-    "vs.",
-}
+import re
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Tuple
+
+_HARD_PUNCT = frozenset({".", "!", "?"})
+_ABBREVIATIONS = frozenset(
+    {
+        # Common legal abbreviations in PT-BR that end with dot and should not split sentences
+        "art.",
+        "arts.",
+        "inc.",
+        "incs.",
+        "al.",
+        "n.",
+        "nº",
+        "no.",
+        "vol.",
+        "v.",
+        "vs.",
+    }
+)
 
 
 def _is_decimal_point(text: str, i: int) -> bool:
-    if i < 0 or i >= len(text) or text[i] != ".":
-        return False
-    prev_c = text[i - 1] if i - 1 >= 0 else ""
-    next_c = text[i + 1] if i + 1 < len(text) else ""
-    return prev_c.isdigit() and next_c.isdigit()
+    """True if the '.' at ``i`` sits between two digits; the caller checked the dot."""
+    return 0 < i < len(text) - 1 and text[i - 1].isdigit() and text[i + 1].isdigit()
 
 
 def _looks_like_abbreviation(text: str, i: int) -> bool:
@@ -54,14 +54,25 @@ def _is_hard_break(text: str, i: int) -> bool:
     return False
 
 
-def _is_soft_break(text: str, i: int) -> bool:
-    c = text[i]
-    if c in _SOFT_PUNCT:
-        return True
-    if c == "\n":  # single newline as soft break
-        if not (i - 1 >= 0 and text[i - 1] == "\n"):
-            return True
-    return False
+# Every position _is_hard_break can accept
+_HARD_BREAK_CANDIDATE_RE = re.compile(r"[.!?]|(?<=\n)\n")
+# Soft breaks: ";" or ":", or a single newline (not the second of a pair)
+_SOFT_BREAK_RE = re.compile(r"[;:]|(?<!\n)\n")
+
+
+class BreakIndex:
+    """
+    Sorted offsets of the hard and soft breaks of one text, so boundary
+    searches bisect instead of testing every character of the window.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.hard: List[int] = [
+            m.start()
+            for m in _HARD_BREAK_CANDIDATE_RE.finditer(text)
+            if _is_hard_break(text, m.start())
+        ]
+        self.soft: List[int] = [m.start() for m in _SOFT_BREAK_RE.finditer(text)]
 
 
 def find_left_boundary(
@@ -70,6 +81,7 @@ def find_left_boundary(
     *,
     min_chars: int = 120,
     max_backtrack: Optional[int] = 600,
+    breaks: Optional[BreakIndex] = None,
 ) -> int:
     if not text:
         return 0
@@ -78,14 +90,25 @@ def find_left_boundary(
     target = max(0, anchor - max(0, min_chars))
     floor = max(0, anchor - max_backtrack) if max_backtrack else 0
 
+    if breaks is not None:
+        # Nearest hard break at or before target, else nearest soft one
+        for offsets in (breaks.hard, breaks.soft):
+            j = bisect_right(offsets, target) - 1
+            if j >= 0 and offsets[j] >= floor:
+                return offsets[j] + 1
+        return floor
+
+    # Without an index, scan only the candidate positions in [floor, target]:
+    # the nearest hard break before target, else the nearest soft one
+    best_hard = None
+    for m in _HARD_BREAK_CANDIDATE_RE.finditer(text, floor, target + 1):
+        if _is_hard_break(text, m.start()):
+            best_hard = m.start() + 1
+    if best_hard is not None:
+        return best_hard
     best_soft = None
-    i = target
-    while i >= floor:
-        if _is_hard_break(text, i):
-            return i + 1
-        if best_soft is None and _is_soft_break(text, i):
-            best_soft = i + 1
-        i -= 1
+    for m in _SOFT_BREAK_RE.finditer(text, floor, target + 1):
+        best_soft = m.start() + 1
     if best_soft is not None:
         return best_soft
     return floor
@@ -97,6 +120,7 @@ def find_right_boundary(
     *,
     min_chars: int = 120,
     max_ahead: Optional[int] = 600,
+    breaks: Optional[BreakIndex] = None,
 ) -> int:
     if not text:
         return 0
@@ -105,16 +129,22 @@ def find_right_boundary(
     target = min(n, anchor + max(0, min_chars))
     ceil = min(n, anchor + max_ahead) if max_ahead else n
 
-    best_soft = None
-    i = target
-    while i < ceil:
-        if _is_hard_break(text, i):
-            return i + 1
-        if best_soft is None and _is_soft_break(text, i):
-            best_soft = i + 1
-        i += 1
-    if best_soft is not None:
-        return best_soft
+    if breaks is not None:
+        # Nearest hard break at or after target, else nearest soft one
+        for offsets in (breaks.hard, breaks.soft):
+            j = bisect_left(offsets, target)
+            if j < len(offsets) and offsets[j] < ceil:
+                return offsets[j] + 1
+        return ceil
+
+    # Without an index, scan only the candidate positions in [target, ceil):
+    # the nearest hard break after target, else the nearest soft one
+    for m in _HARD_BREAK_CANDIDATE_RE.finditer(text, target, ceil):
+        if _is_hard_break(text, m.start()):
+            return m.start() + 1
+    soft = _SOFT_BREAK_RE.search(text, target, ceil)
+    if soft is not None:
+        return soft.start() + 1
     return ceil
 
 
@@ -127,6 +157,7 @@ def build_sentence_bounded_range(
     max_chars: Optional[int] = 600,
     lock_left: bool = False,
     lock_right: bool = False,
+    breaks: Optional[BreakIndex] = None,
 ) -> Tuple[int, int]:
     if not text:
         return (0, 0)
@@ -135,24 +166,36 @@ def build_sentence_bounded_range(
     end = max(0, min(end, n))
     if start > end:
         start, end = end, start
+    if lock_left and lock_right:
+        # Both edges pinned to the span: no boundary to look for
+        return (start, end)
 
     left = (
         start
         if lock_left
         else find_left_boundary(
-            text, start, min_chars=min_chars, max_backtrack=max_chars
+            text, start, min_chars=min_chars, max_backtrack=max_chars, breaks=breaks
         )
     )
     right = (
         end
         if lock_right
-        else find_right_boundary(text, end, min_chars=min_chars, max_ahead=max_chars)
+        else find_right_boundary(
+            text, end, min_chars=min_chars, max_ahead=max_chars, breaks=breaks
+        )
     )
     left = min(left, start)
     right = max(right, end)
     return (left, right)
 
 
+def needle_search_window(
+    text: str, start: int, end: int, needle: str
+) -> Tuple[int, int]:
+    """Span ``[start, end)`` widened by ``len(needle)`` on each side, clamped to ``text``."""
+    return (max(0, start - len(needle)), min(len(text), end + len(needle)))
+
+
 def choose_split_without_overlap(
     text: str,
     left_min: int,
@@ -162,19 +205,19 @@ def choose_split_without_overlap(
 ) -> int:
     left_min = max(0, left_min)
     right_max = max(left_min, right_max)
-    segment = text[left_min:right_max]
+    end = min(right_max, len(text))
+    # Only punctuation/newline positions can be breaks: jump between them with
+    # the candidate regexes instead of testing every character. Last hard
+    # break wins; else the first soft one
     best_hard = None
-    best_soft = None
-    for offset, _ in enumerate(segment):
-        i = left_min + offset
-        if _is_hard_break(text, i):
-            best_hard = i + 1
-        elif best_soft is None and _is_soft_break(text, i):
-            best_soft = i + 1
+    for m in _HARD_BREAK_CANDIDATE_RE.finditer(text, left_min, end):
+        if _is_hard_break(text, m.start()):
+            best_hard = m.start() + 1
     if best_hard is not None:
         return best_hard
-    if best_soft is not None:
-        return best_soft
+    soft = _SOFT_BREAK_RE.search(text, left_min, end)
+    if soft is not None:
+        return soft.start() + 1
     mid = (left_min + right_max) // 2
     j = mid
     while j > left_min:
@@ -185,8 +228,10 @@ def choose_split_without_overlap(
 
 
 __all__ = [
+    "BreakIndex",
     "find_left_boundary",
     "find_right_boundary",
     "build_sentence_bounded_range",
+    "needle_search_window",
     "choose_split_without_overlap",
 ]
@@ -1,16 +1,33 @@
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from time import perf_counter
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
+
+from pydantic import TypeAdapter
 
 from lexaudit.config.settings import SETTINGS
-from lexaudit.core.models import CitationSuspect, IdentifiedCitation
+from lexaudit.core.models import (
+    BatchIdentifiedCitations,
+    CitationSuspect,
+    IdentifiedCitation,
+    IdentifiedCitations,
+    IndexedIdentifiedCitations,
+)
 from lexaudit.core.structured_llm import IdentifierLLM
 
 logger = logging.getLogger(__name__)
 
+# Serializes proposals with pydantic's compiled serializer in one call
+_PROPOSALS_ADAPTER = TypeAdapter(List[IdentifiedCitation])
+
+# Snippets whose final citations are kept per identifier (FIFO eviction)
+_IDENTIFICATION_CACHE_SIZE = 4096
+
 
 class CitationIdentifier:
     """
@@ -31,6 +48,16 @@ class CitationIdentifier:
         self.model_name = self.llm_service.model_name
         # Review config
         self.enable_review = enable_review
+        # (snippet digest, review enabled) -> final citations. Sampled outputs
+        # (temperature > 0) are not reproducible, so they are never cached
+        self.temperature = (
+            temperature if temperature is not None else SETTINGS.llm_temperature
+        )
+        self._cache: Optional[Dict[Tuple[bytes, bool], List[IdentifiedCitation]]] = (
+            {} if self.temperature == 0 else None
+        )
+        # process_batch may share one identifier across document threads
+        self._cache_lock = threading.Lock()
         logger.info(
             "[Identifier] LLM configured: provider=%s model=%s available=%s",
             getattr(SETTINGS, "llm_provider", "unknown"),
@@ -45,145 +72,291 @@ class CitationIdentifier:
         max_workers: int = 10,
     ) -> List[CitationSuspect]:
         """
-        Runs the identification agent (and the reviewer, if enabled) for
-        each suspect in parallel and returns the list with identified_citations filled in.
+        Runs the identification agent (and the reviewer, if enabled) for all
+        suspects concurrently and returns the list with identified_citations
+        filled in, in input order.
+
+        Suspects are sent ``SETTINGS.identification_batch_size`` at a time in
+        one numbered prompt (all of them when the size is 0); a suspect
+        missing from a grouped answer (or a whole group whose call fails)
+        falls back to its own single call.
+        ``max_workers`` bounds how many LLM requests are in flight at once.
+        Suspects sharing a context snippet are sent only once, and snippets
+        already answered by this identifier are served from its cache.
         """
         if not suspects:
             return []
 
         logger.info(
-            "Starting identification for %d suspects (review=%s, workers=%d)",
+            "Starting identification for %d suspects (review=%s, concurrency=%d)",
             len(suspects),
             self.enable_review,
             max_workers,
         )
+        if not self.llm_service.available:
+            logger.warning("LLM unavailable; skipping identification")
+            return [replace(suspect, identified_citations=[]) for suspect in suspects]
 
-        processed: List[CitationSuspect] = []
-        
-        # Helper function for single item processing
-        def process_suspect(suspect: CitationSuspect) -> CitationSuspect:
-            t0 = perf_counter()
-            logger.info(
-                "Identifying suspect span=(%d,%d) len=%d",
-                suspect.start,
-                suspect.end,
-                len(suspect.context_snippet or ""),
-            )
-            identified_suspect = self._run_identifier_agent(suspect)
-            if self.enable_review and identified_suspect.identified_citations:
-                identified_suspect = self._run_reviewer_agent(identified_suspect)
-            dt = perf_counter() - t0
-            logger.info(
-                "Finished suspect (%d citations) in %.2fs",
-                len(identified_suspect.identified_citations or []),
-                dt,
-            )
-            return identified_suspect
-
-        # Use ThreadPoolExecutor for parallel execution
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks, mapping future to index to preserve order
-            future_to_index = {
-                executor.submit(process_suspect, suspect): i
-                for i, suspect in enumerate(suspects)
-            }
-            
-            results = [None] * len(suspects)
-            for future in as_completed(future_to_index):
-                index = future_to_index[future]
-                try:
-                    results[index] = future.result()
-                except Exception as exc:
-                    logger.error("Suspect processing generated an exception: %s", exc)
-                    # Return original suspect with empty citations on failure
-                    results[index] = suspects[index]
-
-        # Reconstruct list (results is already ordered by index)
-        processed = results
+        t0 = perf_counter()
+        processed: List[Optional[CitationSuspect]] = [None] * len(suspects)
+        # snippet key -> positions of the suspects sharing that snippet
+        pending: Dict[Tuple[bytes, bool], List[int]] = {}
+        for i, suspect in enumerate(suspects):
+            key = self._cache_key(suspect.context_snippet)
+            cached = self._cache_get(key)
+            if cached is not None:
+                processed[i] = replace(suspect, identified_citations=list(cached))
+            else:
+                pending.setdefault(key, []).append(i)
+        if not pending:
+            logger.info("Reusing cached identification for %d suspects", len(suspects))
+            return processed  # type: ignore[return-value]
+
+        unique = [suspects[positions[0]] for positions in pending.values()]
+        # Non-positive size: every snippet of the document in a single prompt
+        batch_size = SETTINGS.identification_batch_size
+        if batch_size <= 0:
+            batch_size = len(unique)
+        groups = [unique[i : i + batch_size] for i in range(0, len(unique), batch_size)]
+        logger.info(
+            "Invoking LLM identify%s (model=%s, inputs=%d, cached=%d, groups=%d)",
+            " + review" if self.enable_review else "",
+            self.model_name,
+            len(unique),
+            len(suspects) - sum(map(len, pending.values())),
+            len(groups),
+        )
+        # Each group runs identify and then review in the same task, so its
+        # review starts as soon as its own identification returns instead of
+        # waiting for the slowest identification of the document
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(groups)))
+        ) as executor:
+            results = [
+                suspect
+                for group in executor.map(self._identify_and_review_group, groups)
+                for suspect in group
+            ]
+        for (key, positions), result in zip(pending.items(), results):
+            for i in positions:
+                processed[i] = replace(
+                    suspects[i], identified_citations=list(result.identified_citations)
+                )
+            # An empty result may be a failed call: leave it to be retried
+            if result.identified_citations:
+                self._cache_put(key, list(result.identified_citations))
+        logger.info(
+            "Identified %d suspects in %.2fs", len(suspects), perf_counter() - t0
+        )
 
         logger.info("Completed identification stage")
+        return processed  # type: ignore[return-value]
+
+    def _cache_get(self, key: Tuple[bytes, bool]) -> Optional[List[IdentifiedCitation]]:
+        if self._cache is None:
+            return None
+        with self._cache_lock:
+            return self._cache.get(key)
+
+    def _cache_put(
+        self, key: Tuple[bytes, bool], citations: List[IdentifiedCitation]
+    ) -> None:
+        if self._cache is None:
+            return
+        with self._cache_lock:
+            if (
+                key not in self._cache
+                and len(self._cache) >= _IDENTIFICATION_CACHE_SIZE
+            ):
+                self._cache.pop(next(iter(self._cache)), None)
+            self._cache[key] = citations
+
+    def _cache_key(self, context_snippet: str) -> Tuple[bytes, bool]:
+        digest = hashlib.blake2b(
+            context_snippet.encode("utf-8"), digest_size=16
+        ).digest()
+        return digest, self.enable_review
+
+    def _identify_and_review(self, suspect: CitationSuspect) -> CitationSuspect:
+        processed = self._run_identifier_agent(suspect)
+        if self.enable_review:
+            processed = self._run_reviewer_agent(processed)
         return processed
 
+    def _identify_and_review_group(
+        self, group: List[CitationSuspect]
+    ) -> List[CitationSuspect]:
+        if len(group) == 1:
+            return [self._identify_and_review(group[0])]
+        processed = self._run_identifier_group(group)
+        if self.enable_review:
+            processed = self._run_reviewer_group(processed)
+        return processed
+
+    @staticmethod
+    def _results_by_index(
+        output: BatchIdentifiedCitations, size: int
+    ) -> Dict[int, IndexedIdentifiedCitations]:
+        """Grouped answer keyed by 1-based index, ignoring indexes out of range."""
+        return {r.index: r for r in output.results if 1 <= r.index <= size}
+
+    def _run_identifier_group(
+        self, group: List[CitationSuspect]
+    ) -> List[CitationSuspect]:
+        try:
+            logger.debug(
+                "Invoking LLM grouped identify (model=%s) with %d snippets",
+                self.model_name,
+                len(group),
+            )
+            output = self.llm_service.identify_grouped(
+                [suspect.context_snippet for suspect in group]
+            )
+        except Exception as exc:
+            logger.warning(
+                "Grouped identification failed (%s); identifying %d suspects one by one",
+                exc,
+                len(group),
+            )
+            return [self._run_identifier_agent(suspect) for suspect in group]
+        by_index = self._results_by_index(output, len(group))
+        return [
+            self._apply_identification(suspect, by_index[i])
+            if i in by_index
+            else self._run_identifier_agent(suspect)
+            for i, suspect in enumerate(group, 1)
+        ]
+
     def _run_identifier_agent(self, suspect: CitationSuspect) -> CitationSuspect:
         if not self.llm_service.available:
-            suspect.identified_citations = []
             logger.warning("LLM unavailable; skipping identification")
-            return suspect
+            return replace(suspect, identified_citations=[])
         try:
-            logger.info("Invoking LLM identify (model=%s)", self.model_name)
+            logger.debug("Invoking LLM identify (model=%s)", self.model_name)
             output = self.llm_service.identify(suspect.context_snippet)
-            built: List[IdentifiedCitation] = []
-            for item in output.citations:
-                try:
-                    built.append(
-                        self._build_identified(
-                            identified_string=getattr(item, "identified_string", "")
-                            or suspect.suspect_string,
-                            formatted_name=getattr(item, "formatted_name", "")
-                            or suspect.suspect_string,
-                            citation_type=getattr(item, "citation_type", None),
-                            confidence=getattr(item, "confidence", 1.0),
-                            justification=getattr(item, "justification", ""),
-                        )
+        except Exception as exc:
+            output = exc
+        return self._apply_identification(suspect, output)
+
+    def _apply_identification(
+        self,
+        suspect: CitationSuspect,
+        output: Union[IdentifiedCitations, IndexedIdentifiedCitations, Exception],
+    ) -> CitationSuspect:
+        if isinstance(output, Exception):
+            logger.warning("Identifier LLM failed: %s", output)
+            return replace(suspect, identified_citations=[])
+        built: List[IdentifiedCitation] = []
+        for item in output.citations:
+            try:
+                # Items are validated IdentifiedCitation models: every field
+                # is present (confidence/justification have defaults)
+                built.append(
+                    self._build_identified(
+                        identified_string=item.identified_string
+                        or suspect.suspect_string,
+                        formatted_name=item.formatted_name or suspect.suspect_string,
+                        citation_type=item.citation_type,
+                        confidence=item.confidence,
+                        justification=item.justification,
                     )
-                except Exception as exc:
-                    logger.warning("Skipping invalid citation item: %s", exc)
-            # Log raw structured result
+                )
+            except Exception as exc:
+                logger.warning("Skipping invalid citation item: %s", exc)
+        # Log raw structured result
+        if logger.isEnabledFor(logging.DEBUG):
             try:
-                logger.info(
+                logger.debug(
                     "LLM identify output: %s...",
                     output.model_dump_json(ensure_ascii=False)[:100],
                 )
             except Exception:
-                logger.info(
+                logger.debug(
                     "LLM identify produced %d items",
                     len(getattr(output, "citations", []) or []),
                 )
-            suspect.identified_citations = built
-            return suspect
-        except Exception as exc:
-            logger.warning("Identifier LLM failed: %s", exc)
-            suspect.identified_citations = []
-            return suspect
+        return replace(suspect, identified_citations=built)
 
     def _run_reviewer_agent(self, suspect: CitationSuspect) -> CitationSuspect:
         if not self.llm_service.available or not suspect.identified_citations:
             return suspect
-        proposals_json = json.dumps(
-            [ic.model_dump() for ic in suspect.identified_citations], ensure_ascii=False
-        )
+        proposals_json = self._proposals_json(suspect)
         try:
-            logger.info(
+            logger.debug(
                 "Invoking LLM review (model=%s) with %d proposals",
                 self.model_name,
                 len(suspect.identified_citations),
             )
-            logger.info("Proposals JSON: %s", proposals_json)
-            reviewed_output = self.llm_service.review(
-                suspect.context_snippet,
-                proposals_json,
+            output = self.llm_service.review(suspect.context_snippet, proposals_json)
+        except Exception as exc:
+            output = exc
+        return self._apply_review(suspect, output)
+
+    def _run_reviewer_group(
+        self, group: List[CitationSuspect]
+    ) -> List[CitationSuspect]:
+        # Suspects without proposals are left as they are, as in the single review
+        pending = [i for i, suspect in enumerate(group) if suspect.identified_citations]
+        if len(pending) <= 1:
+            return [self._run_reviewer_agent(suspect) for suspect in group]
+        items = [
+            (group[i].context_snippet, self._proposals_json(group[i])) for i in pending
+        ]
+        try:
+            logger.debug(
+                "Invoking LLM grouped review (model=%s) with %d items",
+                self.model_name,
+                len(items),
+            )
+            output = self.llm_service.review_grouped(items)
+        except Exception as exc:
+            logger.warning(
+                "Grouped review failed (%s); reviewing %d suspects one by one",
+                exc,
+                len(items),
             )
-            reviewed_list: List[IdentifiedCitation] = list(
-                reviewed_output.citations or []
+            return [self._run_reviewer_agent(suspect) for suspect in group]
+        by_index = self._results_by_index(output, len(items))
+        reviewed = list(group)
+        for k, i in enumerate(pending, 1):
+            reviewed[i] = (
+                self._apply_review(group[i], by_index[k])
+                if k in by_index
+                else self._run_reviewer_agent(group[i])
             )
+        return reviewed
+
+    @staticmethod
+    def _proposals_json(suspect: CitationSuspect) -> str:
+        proposals_json = _PROPOSALS_ADAPTER.dump_json(
+            suspect.identified_citations
+        ).decode("utf-8")
+        logger.debug("Proposals JSON: %s", proposals_json)
+        return proposals_json
+
+    def _apply_review(
+        self,
+        suspect: CitationSuspect,
+        output: Union[IdentifiedCitations, IndexedIdentifiedCitations, Exception],
+    ) -> CitationSuspect:
+        if isinstance(output, Exception):
+            logger.warning("Reviewer step failed: %s", output)
+            return suspect
+        reviewed_list: List[IdentifiedCitation] = list(output.citations or [])
+        if logger.isEnabledFor(logging.DEBUG):
             try:
-                logger.info(
+                logger.debug(
                     "LLM review output: %s",
-                    reviewed_output.model_dump_json(ensure_ascii=False),
+                    output.model_dump_json(ensure_ascii=False),
                 )
             except Exception:
-                logger.info(
+                logger.debug(
                     "LLM review produced %d items",
                     len(reviewed_list),
                 )
-            if reviewed_list:
-                suspect.identified_citations = reviewed_list
-            return suspect
-        except Exception as exc:
-            logger.warning("Reviewer step failed: %s", exc)
-            return suspect
+        if reviewed_list:
+            return replace(suspect, identified_citations=reviewed_list)
+        return suspect
 
     def _build_identified(
         self,
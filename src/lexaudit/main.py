@@ -6,48 +6,76 @@ import argparse
 import json
 import logging
 import sys
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
-from dotenv import load_dotenv
+try:  # optional: parses the sample file one document at a time
+    import ijson
+except ImportError:
+    ijson = None
 
 from lexaudit.config.settings import SETTINGS
 from lexaudit.core.pipeline import LexAuditPipeline
+from lexaudit.extraction.detector import stop_linker_container
 from lexaudit.text_extraction import extract_text_from_file
 
 logger = logging.getLogger(__name__)
 
 
-def load_stj_sample(file_path: str) -> List[Dict]:
+def _stj_document(item: Dict) -> Dict:
+    """Extract the fields our pipeline uses from one STJ record."""
+    return {
+        "id": item.get("id", "unknown"),
+        "numero_processo": item.get("numeroProcesso", ""),
+        "citations": item.get("referenciasLegislativas", []),
+        "inteiroTeor": item.get("inteiroTeor", ""),
+        "metadata": {
+            "ementa": item.get("ementa", ""),
+            "data_decisao": item.get("dataDecisao", ""),
+            "ministro_relator": item.get("ministroRelator", ""),
+        },
+    }
+
+
+def iter_stj_sample(file_path: str) -> Iterator[Dict]:
     """
-    Load STJ sample data from JSON file.
+    Yield STJ sample documents one at a time.
+
+    With ijson installed the JSON array is parsed incrementally, so only the
+    current record is held in memory; otherwise the file is read with
+    json.load first.
 
     Args:
         file_path: Path to the JSON file
 
-    Returns:
-        List of documents with their legislative references
+    Yields:
+        Documents with their legislative references
     """
+    if ijson is not None:
+        with open(file_path, "rb") as f:
+            for item in ijson.items(f, "item"):
+                yield _stj_document(item)
+        return
+
     with open(file_path, "r", encoding="utf-8") as f:
         data = json.load(f)
-
-    # Extract relevant information for our pipeline
-    documents = []
     for item in data:
-        doc = {
-            "id": item.get("id", "unknown"),
-            "numero_processo": item.get("numeroProcesso", ""),
-            "citations": item.get("referenciasLegislativas", []),
-            "inteiroTeor": item.get("inteiroTeor", ""),
-            "metadata": {
-                "ementa": item.get("ementa", ""),
-                "data_decisao": item.get("dataDecisao", ""),
-                "ministro_relator": item.get("ministroRelator", ""),
-            },
-        }
-        documents.append(doc)
-
-    return documents
+        yield _stj_document(item)
+
+
+def load_stj_sample(file_path: str, limit: Optional[int] = None) -> List[Dict]:
+    """
+    Load STJ sample data from JSON file.
+
+    Args:
+        file_path: Path to the JSON file
+        limit: Stop after this many documents (None loads all of them)
+
+    Returns:
+        List of documents with their legislative references
+    """
+    return list(islice(iter_stj_sample(file_path), limit))
 
 
 def run_pipeline_on_file(file_path: Path):
@@ -95,9 +123,9 @@ def run_sample_mode():
     logger.info("Loading data from: %s", data_path)
     logger.info("")
 
-    # Load data
+    # Load data (only the first document is processed below)
     try:
-        documents = load_stj_sample(str(data_path))
+        documents = load_stj_sample(str(data_path), limit=1)
         logger.info("Loaded %d documents", len(documents))
         logger.info("")
     except Exception as e:
@@ -147,9 +175,6 @@ def run_sample_mode():
 
 
 def main():
-    # Load .env from config directory
-    load_dotenv(Path(__file__).parent.parent.parent / "config" / ".env")
-
     # Configure logging from settings
     level_name = getattr(SETTINGS, "logging_level", "INFO")
     level = getattr(logging, level_name.upper(), logging.INFO)
@@ -166,15 +191,18 @@ def main():
     
     args = parser.parse_args()
 
-    if args.file:
-        file_path = Path(args.file)
-        if not file_path.exists():
-            logger.error("File not found: %s", file_path)
-            sys.exit(1)
-        run_pipeline_on_file(file_path)
-    else:
-        # Default behavior or explicit sample flag
-        run_sample_mode()
+    try:
+        if args.file:
+            file_path = Path(args.file)
+            if not file_path.exists():
+                logger.error("File not found: %s", file_path)
+                sys.exit(1)
+            run_pipeline_on_file(file_path)
+        else:
+            # Default behavior or explicit sample flag
+            run_sample_mode()
+    finally:
+        stop_linker_container()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Tuple, Union
+
+from lexaudit.config.settings import SETTINGS
+
+# Anthropic only reuses a prefix up to an explicit cache breakpoint
+_CACHE_SYSTEM_PROMPT = SETTINGS.llm_provider == "anthropic"
+
+
+def system_message(prompt: str) -> Tuple[str, Union[str, List[Dict[str, Any]]]]:
+    """
+    System message for ``ChatPromptTemplate.from_messages``.
+
+    System prompts are constant and always come first, so every call of a
+    prompt shares the same prefix. OpenAI and Gemini cache such prefixes on
+    their own; for Anthropic the prompt is sent as a text block marked as a
+    cache breakpoint (``cache_control``) so it is billed once per cache window.
+    """
+    if _CACHE_SYSTEM_PROMPT:
+        return (
+            "system",
+            [
+                {
+                    "type": "text",
+                    "text": prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+        )
+    return ("system", prompt)
+
+
+def few_shot_json(example: Any) -> str:
+    """
+    ``example`` as compact JSON (no indentation or spaces after separators,
+    fewer prompt tokens) with braces escaped for ChatPromptTemplate.
+    """
+    compact = json.dumps(example, ensure_ascii=False, separators=(",", ":"))
+    return compact.replace("{", "{{").replace("}", "}}")
+
+
+__all__ = ["few_shot_json", "system_message"]
@@ -1,6 +1,8 @@
 from langchain_core.prompts import ChatPromptTemplate
 
-IDENTIFICATION_SYSTEM_PROMPT = """
+from .common import few_shot_json, system_message
+
+_IDENTIFICATION_INSTRUCTIONS = """
 Você é um agente especialista em identificar referências em trechos de textos do universo jurídico 
 brasileiro, que pode conter referências a outros documentos.
 Você receberá apenas o trecho completo (context_snippet) com todo o contexto
@@ -31,54 +33,58 @@ Boas práticas:
 
 
 Exemplos (few-shot):
-Trecho:
-"Conforme o art. 5º, inciso XXXV, da CF/88 e a Lei 9.784/1999, a Administração deve observar o devido processo."
-Saída esperada:
-{{
-  "citations": [
-    {{
-      "identified_string": "art. 5º, inciso XXXV, da CF/88",
-      "formatted_name": "Constituição Federal de 1988, art. 5º, inciso XXXV",
-      "citation_type": "Constituição Federal",
-      "confidence": 0.95,
-      "justification": "Menção explícita à CF/88 e ao inciso indicado."
-    }},
-    {{
-      "identified_string": "Lei 9.784/1999",
-      "formatted_name": "Lei nº 9.784, de 1999 (Processo Administrativo Federal)",
-      "citation_type": "Lei federal",
-      "confidence": 0.90,
-      "justification": "Lei federal citada textualmente no trecho."
-    }}
-  ]
-}}
-Trecho:
-"Segundo a Súmula 7/STJ e o REsp 1.068.041/PR, não cabe reexame de provas."
-Saída esperada:
-{{
-  "citations": [
-    {{
-      "identified_string": "Súmula 7/STJ",
-      "formatted_name": "Súmula 7 do Superior Tribunal de Justiça",
-      "citation_type": "Súmula",
-      "confidence": 0.92,
-      "justification": "Súmula do STJ mencionada diretamente."
-    }},
-    {{
-      "identified_string": "REsp 1.068.041/PR",
-      "formatted_name": "Recurso Especial 1.068.041/PR (STJ)",
-      "citation_type": "Recurso Especial",
-      "confidence": 0.85,
-      "justification": "Precedente do STJ citado no trecho."
-    }}
-  ]
-}}
+"""
+
+# Few-shot examples: (trecho, citações esperadas), rendered as compact JSON
+_IDENTIFICATION_EXAMPLES = [
+    (
+        "Conforme o art. 5º, inciso XXXV, da CF/88 e a Lei 9.784/1999, a Administração deve observar o devido processo.",
+        [
+            {
+                "identified_string": "art. 5º, inciso XXXV, da CF/88",
+                "formatted_name": "Constituição Federal de 1988, art. 5º, inciso XXXV",
+                "citation_type": "Constituição Federal",
+                "confidence": 0.95,
+                "justification": "Menção explícita à CF/88 e ao inciso indicado.",
+            },
+            {
+                "identified_string": "Lei 9.784/1999",
+                "formatted_name": "Lei nº 9.784, de 1999 (Processo Administrativo Federal)",
+                "citation_type": "Lei federal",
+                "confidence": 0.90,
+                "justification": "Lei federal citada textualmente no trecho.",
+            },
+        ],
+    ),
+    (
+        "Segundo a Súmula 7/STJ e o REsp 1.068.041/PR, não cabe reexame de provas.",
+        [
+            {
+                "identified_string": "Súmula 7/STJ",
+                "formatted_name": "Súmula 7 do Superior Tribunal de Justiça",
+                "citation_type": "Súmula",
+                "confidence": 0.92,
+                "justification": "Súmula do STJ mencionada diretamente.",
+            },
+            {
+                "identified_string": "REsp 1.068.041/PR",
+                "formatted_name": "Recurso Especial 1.068.041/PR (STJ)",
+                "citation_type": "Recurso Especial",
+                "confidence": 0.85,
+                "justification": "Precedente do STJ citado no trecho.",
+            },
+        ],
+    ),
+]
 
-""".strip()
+IDENTIFICATION_SYSTEM_PROMPT = _IDENTIFICATION_INSTRUCTIONS.lstrip() + "\n".join(
+    f'Trecho:\n"{snippet}"\nSaída esperada:\n' + few_shot_json({"citations": citations})
+    for snippet, citations in _IDENTIFICATION_EXAMPLES
+)
 
 IDENTIFICATION_PROMPT = ChatPromptTemplate.from_messages(
     [
-        ("system", IDENTIFICATION_SYSTEM_PROMPT),
+        system_message(IDENTIFICATION_SYSTEM_PROMPT),
         (
             "user",
             "Trecho (context_snippet):\n{context_snippet}\n\n"
@@ -87,6 +93,24 @@ IDENTIFICATION_PROMPT = ChatPromptTemplate.from_messages(
     ]
 )
 
+# Vários trechos numerados em uma única chamada; as regras do prompt de sistema
+# valem para cada trecho e a resposta agrupa as citações pelo número do trecho
+IDENTIFICATION_BATCH_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        system_message(IDENTIFICATION_SYSTEM_PROMPT),
+        (
+            "user",
+            "Trechos numerados (cada um é um context_snippet independente):\n"
+            "{numbered_snippets}\n\n"
+            "Aplique as instruções a CADA trecho separadamente. Produza SOMENTE um "
+            "JSON válido no formato "
+            '{{"results": [{{"index": <número do trecho>, "citations": [...]}}]}}, '
+            "com uma entrada por trecho (use citations vazia quando não houver citações).",
+        ),
+    ]
+)
+
 __all__ = [
     "IDENTIFICATION_PROMPT",
+    "IDENTIFICATION_BATCH_PROMPT",
 ]
@@ -4,6 +4,8 @@ Prompt templates and output schemas for citation resolution.
 
 from langchain_core.prompts import ChatPromptTemplate
 
+from .common import system_message
+
 RESOLUTION_SYSTEM_PROMPT = """
 Você é um especialista em resolução de citações jurídicas, especializado em direito brasileiro.
 Sua tarefa é converter citações de LEGISLAÇÃO em identificadores canônicos URN:LEX.
@@ -43,7 +45,7 @@ FEW_SHOT_EXAMPLES = """Exemplos de resolução:
 # Main prompt template
 RESOLUTION_PROMPT = ChatPromptTemplate.from_messages(
     [
-        ("system", RESOLUTION_SYSTEM_PROMPT),
+        system_message(RESOLUTION_SYSTEM_PROMPT),
         (
             "user",
             'Resolva a citação:\n\n"{citation_text}"\nTipo: {citation_type}',
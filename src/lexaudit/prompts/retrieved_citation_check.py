@@ -4,6 +4,8 @@ Prompt templates for document validation during retrieval.
 
 from langchain_core.prompts import ChatPromptTemplate
 
+from .common import system_message
+
 RETRIEVED_CITATION_CHECK_SYSTEM_PROMPT = """
 Você é um especialista em análise de documentos jurídicos brasileiros.
 
@@ -21,7 +23,7 @@ Responda com:
 
 RETRIEVED_CITATION_CHECK_PROMPT = ChatPromptTemplate.from_messages(
     [
-        ("system", RETRIEVED_CITATION_CHECK_SYSTEM_PROMPT),
+        system_message(RETRIEVED_CITATION_CHECK_SYSTEM_PROMPT),
         (
             "user",
             """Citação buscada: "{citation_text}"
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from langchain_core.prompts import ChatPromptTemplate
 
+from .common import system_message
+
 REVIEW_SYSTEM_PROMPT = """
 Você é um revisor de identificações de referências jurídicas.
 
@@ -136,7 +138,7 @@ Saída esperada:
 
 REVIEW_PROMPT = ChatPromptTemplate.from_messages(
     [
-        ("system", REVIEW_SYSTEM_PROMPT),
+        system_message(REVIEW_SYSTEM_PROMPT),
         (
             "user",
             "Trecho (context_snippet):\n{context_snippet}\n\n"
@@ -146,5 +148,21 @@ REVIEW_PROMPT = ChatPromptTemplate.from_messages(
     ]
 )
 
+# Vários itens numerados (trecho + citações propostas) em uma única chamada
+REVIEW_BATCH_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        system_message(REVIEW_SYSTEM_PROMPT),
+        (
+            "user",
+            "Itens numerados (cada um com seu context_snippet e suas citações propostas):\n"
+            "{numbered_items}\n\n"
+            "Revise CADA item separadamente, considerando apenas o seu próprio trecho. "
+            "Produza SOMENTE um JSON válido no formato "
+            '{{"results": [{{"index": <número do item>, "citations": [...]}}]}}, '
+            "com uma entrada por item.",
+        ),
+    ]
+)
+
 
-__all__ = ["REVIEW_PROMPT"]
+__all__ = ["REVIEW_PROMPT", "REVIEW_BATCH_PROMPT"]
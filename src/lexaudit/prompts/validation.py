@@ -1,5 +1,7 @@
 from langchain_core.prompts import ChatPromptTemplate
 
+from .common import system_message
+
 TRIAGE_SYSTEM_PROMPT = """
 Você é um agente especialista em validar citações jurídicas brasileiras.
 
@@ -59,7 +61,7 @@ Forneça sua análise em JSON.
 
 TRIAGE_PROMPT = ChatPromptTemplate.from_messages(
     [
-        ("system", TRIAGE_SYSTEM_PROMPT),
+        system_message(TRIAGE_SYSTEM_PROMPT),
         ("user", TRIAGE_USER_TEMPLATE),
     ]
 )
@@ -68,7 +70,7 @@ TRIAGE_PROMPT = ChatPromptTemplate.from_messages(
 VERIFIER_SYSTEM_PROMPT = """
 Você é um dos agentes verificadores em um debate multi-agente sobre validação de citações jurídicas.
 
-Sua perspectiva específica: {perspective}
+Sua perspectiva específica e seu identificador (agent_id) vêm na mensagem do usuário.
 
 Você receberá:
 1. Os mesmos dados que o agente de triagem
@@ -86,7 +88,7 @@ Use evidências inline no formato:
 
 Formato de saída (JSON):
 {{
-  "agent_id": "{agent_id}",
+  "agent_id": "seu identificador (agent_id)",
   "position": "correct"|"outdated"|"incorrect"|"non_existent",
   "confidence": float (0.0-1.0),
   "argument": "Seu argumento detalhado com evidências inline",
@@ -97,6 +99,11 @@ Seja objetivo, rigoroso e baseado em evidências.
 """
 
 VERIFIER_USER_TEMPLATE = """
+AGENT_ID: {agent_id}
+
+SUA PERSPECTIVA:
+{perspective}
+
 CONTEXTO DA CITAÇÃO:
 {citation_context}
 
@@ -117,7 +124,7 @@ Forneça seu argumento em JSON.
 
 VERIFIER_PROMPT = ChatPromptTemplate.from_messages(
     [
-        ("system", VERIFIER_SYSTEM_PROMPT),
+        system_message(VERIFIER_SYSTEM_PROMPT),
         ("user", VERIFIER_USER_TEMPLATE),
     ]
 )
@@ -168,7 +175,7 @@ Sintetize o debate e forneça a decisão final em JSON.
 
 MODERATOR_PROMPT = ChatPromptTemplate.from_messages(
     [
-        ("system", MODERATOR_SYSTEM_PROMPT),
+        system_message(MODERATOR_SYSTEM_PROMPT),
         ("user", MODERATOR_USER_TEMPLATE),
     ]
 )
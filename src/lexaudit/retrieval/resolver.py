@@ -3,8 +3,11 @@ Citation resolution module.
 Converts textual citations to canonical identifiers (URN:LEX) using LLM.
 """
 
+import json
 import logging
-from typing import List, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Optional, Tuple
 
 from langchain_core.language_models.chat_models import BaseChatModel
 
@@ -12,6 +15,9 @@ from ..core.models import ExtractedCitation, ResolutionOutput, ResolvedCitation
 from ..core.structured_llm import StructuredLLM
 from ..prompts.resolution import RESOLUTION_PROMPT
 
+# JSON object wrapped in a markdown code block (``` or ```json)
+_JSON_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
 
 class CitationResolver:
     """
@@ -40,28 +46,53 @@ class CitationResolver:
         self.model_name = self.llm_core.model_name
 
     def resolve_batch(
-        self, citations: List[ExtractedCitation]
+        self, citations: List[ExtractedCitation], max_workers: int = 1
     ) -> List[ResolvedCitation]:
         """
         Resolve multiple citations.
 
+        With ``max_workers > 1`` the LLM calls run concurrently in threads;
+        the chat model client is shared between them.
+
         Args:
             citations: List of extracted citations
+            max_workers: Number of concurrent resolution calls
 
         Returns:
-            List of resolved citations
+            List of resolved citations, in input order
+        """
+        resolved: List[Optional[ResolvedCitation]] = [None] * len(citations)
+        for idx, resolved_citation in self.iter_resolve(citations, max_workers):
+            resolved[idx] = resolved_citation
+        return resolved
+
+    def iter_resolve(
+        self, citations: List[ExtractedCitation], max_workers: int = 1
+    ) -> Iterator[Tuple[int, ResolvedCitation]]:
+        """
+        Resolve citations, yielding ``(index, resolved)`` as each one finishes.
+
+        Lets callers start downstream work (e.g. retrieval) on early results
+        while the remaining LLM calls are still in flight.
+
+        Args:
+            citations: List of extracted citations
+            max_workers: Number of concurrent resolution calls
+
+        Yields:
+            Index into ``citations`` and its resolved citation, in completion order
         """
         logger = logging.getLogger(__name__)
         logger.info("Resolving %d citations...", len(citations))
-        resolved = []
+        total = len(citations)
 
-        for idx, citation in enumerate(citations, 1):
-            resolved_citation = self.resolve(citation)
+        def _log(idx: int, resolved_citation: ResolvedCitation) -> None:
+            citation = citations[idx]
             if resolved_citation.canonical_id:
-                logger.info(
+                logger.debug(
                     "  [%d/%d] OK %s -> %s (conf: %.2f)",
-                    idx,
-                    len(citations),
+                    idx + 1,
+                    total,
                     citation.formatted_name,
                     resolved_citation.canonical_id,
                     resolved_citation.resolution_confidence,
@@ -69,13 +100,28 @@ class CitationResolver:
             else:
                 logger.warning(
                     "  [%d/%d] FAILED to resolve '%s'",
-                    idx,
-                    len(citations),
+                    idx + 1,
+                    total,
                     citation.formatted_name,
                 )
-            resolved.append(resolved_citation)
 
-        return resolved
+        if not max_workers or max_workers <= 1 or total <= 1:
+            for idx, citation in enumerate(citations):
+                resolved_citation = self.resolve(citation)
+                _log(idx, resolved_citation)
+                yield idx, resolved_citation
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_index = {
+                executor.submit(self.resolve, citation): idx
+                for idx, citation in enumerate(citations)
+            }
+            for future in as_completed(future_to_index):
+                idx = future_to_index[future]
+                resolved_citation = future.result()
+                _log(idx, resolved_citation)
+                yield idx, resolved_citation
 
     def resolve(self, citation: ExtractedCitation) -> ResolvedCitation:
         """
@@ -103,15 +149,12 @@ class CitationResolver:
         )
 
         # Direct invocation bypasses with_structured_output which has timeout issues
-        import json
-        import re
-
         messages = RESOLUTION_PROMPT.format_messages(**values)
         response = self.llm_core.llm.invoke(messages)
         content = response.content
 
         # Extract JSON from markdown code blocks if present
-        json_match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", content, re.DOTALL)
+        json_match = _JSON_CODE_BLOCK_RE.search(content)
         if json_match:
             content = json_match.group(1)
 
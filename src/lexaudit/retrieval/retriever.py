@@ -6,23 +6,53 @@ import hashlib
 import json
 import logging
 import os
+import re
 import tempfile
 import uuid
 import xml.etree.ElementTree as ET
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional
 
 import requests
 import trafilatura
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from serpapi import GoogleSearch
+from urllib3.util.retry import Retry
 
-from ..core.models import ResolvedCitation, RetrievedDocument
+from ..config.settings import SETTINGS
+from ..core.models import CitationRetrieval, ResolvedCitation, RetrievedDocument
 from ..core.structured_llm import StructuredLLM
 from ..prompts.retrieved_citation_check import RETRIEVED_CITATION_CHECK_PROMPT
 from .retrieved_citation_check import RetrievedCitationCheck
 
 logger = logging.getLogger(__name__)
 
+# Revoked-section end marker, a short separator, then the next start marker
+_ADJACENT_REVOKED_RE = re.compile(r"<REVOGADO_FIM>([^<]{0,20})<REVOGADO_INICIO>")
+
+
+def create_http_session(pool_size: int = 32) -> requests.Session:
+    """
+    Build a keep-alive session with a connection pool sized for concurrent use.
+
+    Retries cover transient gateway errors from the official sites.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=("GET",),
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 class LegalDocumentRetriever:
     """
@@ -34,9 +64,14 @@ class LegalDocumentRetriever:
 
     LEXML_SRU_BASE = "https://www.lexml.gov.br/busca/SRU"
 
-    def __init__(self):
-        """Initialize the retriever."""
-        self.session = requests.Session()
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize the retriever.
+
+        Args:
+            session: Shared HTTP session; a pooled one is created if omitted
+        """
+        self.session = session if session is not None else create_http_session()
         self.llm = StructuredLLM()
         # Set browser-like headers to avoid being blocked by government sites
         self.session.headers.update(
@@ -85,6 +120,52 @@ class LegalDocumentRetriever:
             )
             return None
 
+    def retrieve_batch(
+        self, resolved_citations: Iterable[ResolvedCitation], max_workers: int = 1
+    ) -> List[CitationRetrieval]:
+        """
+        Retrieve documents for multiple resolved citations.
+
+        With ``max_workers > 1`` citations are fetched concurrently, sharing this
+        retriever's pooled HTTP session and LLM client. The input may be a
+        generator: each citation is submitted as soon as it is yielded.
+
+        Args:
+            resolved_citations: Citations with canonical identifiers
+            max_workers: Number of concurrent retrieval workers
+
+        Returns:
+            One CitationRetrieval per citation, in input order
+        """
+        if not max_workers or max_workers <= 1:
+            return [self._retrieve_single(r) for r in resolved_citations]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._retrieve_single, resolved_citations))
+
+    def _retrieve_single(self, resolved: ResolvedCitation) -> CitationRetrieval:
+        """Retrieve one citation, turning failures into an 'error' status."""
+        try:
+            doc = self.retrieve(resolved)
+        except Exception as exc:  # noqa: BLE001
+            return self._failed_retrieval(resolved, exc)
+        return CitationRetrieval(
+            resolved_citation=resolved,
+            retrieved_document=doc,
+            retrieval_status="success" if doc else "not_found",
+        )
+
+    @staticmethod
+    def _failed_retrieval(
+        resolved: ResolvedCitation, exc: Exception
+    ) -> CitationRetrieval:
+        logger.warning("Retrieval failed for %s: %s", resolved.canonical_id, exc)
+        return CitationRetrieval(
+            resolved_citation=resolved,
+            retrieval_status="error",
+            retrieval_metadata={"error": str(exc)},
+        )
+
     def _retrieve_from_google(
         self, canonical_id: str, raw_citation: str
     ) -> Optional[RetrievedDocument]:
@@ -119,9 +200,9 @@ class LegalDocumentRetriever:
     def _search_google(self, query: str) -> list[str]:
         """Search Google and return list of URLs."""
         try:
-            api_key = os.getenv("SERPAPI_API_KEY")
+            api_key = SETTINGS.serpapi_api_key
             if not api_key:
-                logger.warning("SERPAPI_API_KEY not set")
+                logger.warning("serpapi_api_key not set")
                 return []
 
             search = GoogleSearch({"q": query, "api_key": api_key, "num": 10})
@@ -215,11 +296,13 @@ class LegalDocumentRetriever:
 
         # Find all strike/s/del tags and unwrap them with markers
         strike_tags = soup.find_all(["strike", "s", "del"])
-        logger.debug(f"Found {len(strike_tags)} strikethrough tags")
+        logger.debug("Found %d strikethrough tags", len(strike_tags))
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
         for i, tag in enumerate(strike_tags):
-            preview = tag.get_text()[:100].replace("\n", " ")
-            logger.debug(f"Strike tag {i + 1}: {preview}...")
+            if debug_enabled:
+                preview = tag.get_text()[:100].replace("\n", " ")
+                logger.debug("Strike tag %d: %s...", i + 1, preview)
 
             # Insert marker before the tag content
             marker_before = soup.new_string("<REVOGADO_INICIO>")
@@ -236,7 +319,6 @@ class LegalDocumentRetriever:
 
     def _merge_adjacent_revoked(self, text: str) -> str:
         """Merge adjacent revoked sections separated by short content."""
-        import re
 
         # Pattern: <REVOGADO_FIM> followed by short content, then <REVOGADO_INICIO>
         # Captures: whitespace, newlines, bullets (-, *, •), and short text (< 4 chars)
@@ -251,9 +333,7 @@ class LegalDocumentRetriever:
 
         # Match end tag, separator content, and start tag
         # Allow for bullets, whitespace, and short strings
-        merged = re.sub(
-            r"<REVOGADO_FIM>([^<]{0,20})<REVOGADO_INICIO>", should_merge, text
-        )
+        merged = _ADJACENT_REVOKED_RE.sub(should_merge, text)
 
         return merged
 
@@ -3,12 +3,13 @@ Citation validator orchestrating triage and multi-agent debate.
 """
 
 import logging
-from typing import List
+from typing import List, get_args
 
 from ..core.models import (
     CitationRetrieval,
     ValidatedCitation,
     ValidationStatus,
+    ValidationStatusLiteral,
     ValidationOutput,
     DebateOutput,
 )
@@ -17,6 +18,8 @@ from .debate_graph import DebateGraph
 
 logger = logging.getLogger(__name__)
 
+_VALID_STATUSES = frozenset(get_args(ValidationStatusLiteral))
+
 
 class CitationValidator:
     """
@@ -53,11 +56,11 @@ class CitationValidator:
 
             logger.info(
                 "  -> Triage decision final: %s (confidence=%.2f)",
-                status.value,
+                status,
                 triage_decision.confidence,
             )
 
-            final_status = status.value
+            final_status = status
             final_confidence = triage_decision.confidence
             final_justification = triage_decision.reasoning
 
@@ -73,11 +76,11 @@ class CitationValidator:
 
             logger.info(
                 "  -> Debate decision final: %s (confidence=%.2f)",
-                status.value,
+                status,
                 debate_decision["confidence"],
             )
 
-            final_status = status.value
+            final_status = status
             final_confidence = debate_decision["confidence"]
             final_justification = debate_decision["justification"]
 
@@ -133,21 +136,15 @@ class CitationValidator:
         return validated, validation_outputs
 
     @staticmethod
-    def _map_status(status_str: str) -> ValidationStatus:
+    def _map_status(status_str: str) -> ValidationStatusLiteral:
         """
-        Map string status to ValidationStatus enum.
+        Normalize a status string from an agent.
 
         Args:
             status_str: Status string from agent
 
         Returns:
-            ValidationStatus enum value
+            One of the ValidationStatus values (pending when unrecognized)
         """
-        status_map = {
-            "correct": ValidationStatus.CORRECT,
-            "outdated": ValidationStatus.OUTDATED,
-            "incorrect": ValidationStatus.INCORRECT,
-            "non_existent": ValidationStatus.NON_EXISTENT,
-            "pending": ValidationStatus.PENDING,
-        }
-        return status_map.get(status_str.lower(), ValidationStatus.PENDING)
+        status = status_str.lower()
+        return status if status in _VALID_STATUSES else ValidationStatus.PENDING
@@ -0,0 +1,60 @@
+import unittest
+from dataclasses import replace
+from unittest import mock
+
+from lexaudit.core.models import CitationSuspect, IdentifiedCitation
+from lexaudit.extraction.citation_extractor import CitationExtractor
+
+TEXT = "Conforme a Lei 8.112 de 1990."
+SUSPECT = CitationSuspect(
+    context_snippet=TEXT,
+    suspect_string="Lei 8.112",
+    start=11,
+    end=20,
+    detector_type="regex",
+)
+CITATION = IdentifiedCitation(
+    identified_string="Lei 8.112",
+    formatted_name="Lei nº 8.112, de 1990",
+    citation_type="Lei federal",
+)
+
+
+class ExtractionCacheTest(unittest.TestCase):
+    """Only complete, reproducible extractions are served from the cache."""
+
+    def _extractor(self, temperature, answers):
+        detector = mock.Mock()
+        detector.detect.return_value = [SUSPECT]
+        identifier = mock.Mock(temperature=temperature)
+        identifier.identify_citations.side_effect = [
+            [replace(SUSPECT, identified_citations=citations)] for citations in answers
+        ]
+        return (
+            CitationExtractor(detector=detector, identifier=identifier),
+            identifier,
+        )
+
+    def test_complete_result_is_cached(self):
+        extractor, identifier = self._extractor(0, [[CITATION]])
+        first = extractor.extract_from_text(TEXT)
+        second = extractor.extract_from_text(TEXT)
+        self.assertEqual(first, second)
+        self.assertEqual(len(second), 1)
+        self.assertEqual(identifier.identify_citations.call_count, 1)
+
+    def test_unidentified_suspect_is_not_cached(self):
+        extractor, identifier = self._extractor(0, [[], [CITATION]])
+        self.assertEqual(extractor.extract_from_text(TEXT), [])
+        self.assertEqual(len(extractor.extract_from_text(TEXT)), 1)
+        self.assertEqual(identifier.identify_citations.call_count, 2)
+
+    def test_sampled_result_is_not_cached(self):
+        extractor, identifier = self._extractor(0.7, [[CITATION], [CITATION]])
+        extractor.extract_from_text(TEXT)
+        extractor.extract_from_text(TEXT)
+        self.assertEqual(identifier.identify_citations.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
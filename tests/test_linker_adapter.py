@@ -0,0 +1,190 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from lexaudit.extraction.detector import linker_adapter
+from lexaudit.extraction.detector.linker_adapter import (
+    LinkerExecutionError,
+    LinkerParsingError,
+    LinkerWorker,
+    _anchor_spans,
+    _LinkerHTMLParser,
+)
+
+ORIGINAL = "Conforme a Lei 8.112 de 1990."
+
+
+def _parser_spans(original, decorated):
+    parser = _LinkerHTMLParser(original)
+    try:
+        parser.feed(decorated)
+        parser.close()
+    except LinkerParsingError:
+        return None
+    return parser.references
+
+
+class AnchorSpansParityTest(unittest.TestCase):
+    """The regex fast path must agree with _LinkerHTMLParser whenever it answers."""
+
+    ATTRIBUTES = [
+        'class="lexmlurnlink"',
+        "class='lexmlurnlink'",
+        "class=lexmlurnlink",
+        'class="x lexmlurnlink y"',
+        'href="urn:lex:br:federal:lei:1990-12-11;8112" class="lexmlurnlink"',
+        'CLASS="lexmlurnlink"',
+        'class="LEXMLURNLINK"',
+        'class="x-lexmlurnlink"',
+        'class="lexmlurnlink-old"',
+        'data-class="lexmlurnlink"',
+        'title="lexmlurnlink"',
+        'class="a" class="lexmlurnlink"',
+        'class="lexmlurnlink" class="b"',
+        'class="lex&#109;lurnlink"',
+        'class=""',
+        "",
+    ]
+
+    def test_anchor_attributes(self):
+        for attrs in self.ATTRIBUTES:
+            decorated = f"Conforme a <a {attrs}>Lei 8.112</a> de 1990."
+            with self.subTest(attrs=attrs):
+                fast = _anchor_spans(ORIGINAL, decorated)
+                if fast is not None:
+                    self.assertEqual(fast, _parser_spans(ORIGINAL, decorated))
+
+    def test_linker_class_token_is_exact(self):
+        for attrs in (
+            'class="x-lexmlurnlink"',
+            'class="lexmlurnlink-old"',
+            'data-class="lexmlurnlink"',
+        ):
+            decorated = f"<a {attrs}>Lei 8.112</a>"
+            with self.subTest(attrs=attrs):
+                self.assertEqual(_parser_spans("Lei 8.112", decorated), [])
+                self.assertIn(_anchor_spans("Lei 8.112", decorated), ([], None))
+
+    def test_linker_anchor_span(self):
+        decorated = 'Conforme a <a class="lexmlurnlink">Lei 8.112</a> de 1990.'
+        self.assertEqual(_anchor_spans(ORIGINAL, decorated), [(11, 20)])
+        self.assertEqual(_parser_spans(ORIGINAL, decorated), [(11, 20)])
+
+
+class LinkerWorkerPoolTest(unittest.TestCase):
+    """Persistent mode keeps up to linker_max_parallel workers per key."""
+
+    def setUp(self):
+        patches = [
+            mock.patch.object(linker_adapter.SETTINGS, "linker_mode", "persistent"),
+            mock.patch.object(linker_adapter.SETTINGS, "linker_max_parallel", 2),
+            mock.patch.object(linker_adapter, "_ensure_linker_container"),
+            mock.patch.object(linker_adapter, "LinkerWorker"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        linker_adapter.LinkerWorker.side_effect = lambda *args, **kwargs: mock.Mock()
+        self.addCleanup(linker_adapter._close_linker_workers)
+
+    def test_busy_workers_are_not_shared(self):
+        first = linker_adapter._acquire_linker_worker("html", "federal")
+        second = linker_adapter._acquire_linker_worker("html", "federal")
+        self.assertIsNot(first, second)
+        linker_adapter._release_linker_worker("html", "federal", first)
+        self.assertIs(linker_adapter._acquire_linker_worker("html", "federal"), first)
+
+    def test_container_start_does_not_hold_the_pool(self):
+        free = []
+
+        def probe_pool():
+            cond = linker_adapter._workers_cond
+            if cond.acquire(blocking=False):
+                cond.release()
+                free.append(True)
+            else:
+                free.append(False)
+
+        def ensure():
+            # The condition is reentrant, so probe it from another thread
+            thread = threading.Thread(target=probe_pool)
+            thread.start()
+            thread.join()
+            return "lexaudit-linker"
+
+        linker_adapter._ensure_linker_container.side_effect = ensure
+        linker_adapter._acquire_linker_worker("html", "federal")
+        self.assertEqual(free, [True])
+
+    def test_closed_workers_are_not_reused(self):
+        worker = linker_adapter._acquire_linker_worker("html", "federal")
+        linker_adapter._close_linker_workers()
+        linker_adapter._release_linker_worker("html", "federal", worker)
+        worker.close.assert_called_once()
+        self.assertIsNot(
+            linker_adapter._acquire_linker_worker("html", "federal"), worker
+        )
+
+
+class LinkerWorkerTimeoutTest(unittest.TestCase):
+    def test_timeout_runs_kill_command(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            marker = os.path.join(tmp, "killed")
+            worker = LinkerWorker(
+                ["/bin/sh", "-c", "read -r n; exec sleep 5"],
+                kill_command=["/bin/sh", "-c", f"touch {marker}"],
+            )
+            with self.assertRaisesRegex(LinkerExecutionError, "timed out"):
+                worker.process("Lei 8.112", timeout=0.2)
+            self.assertTrue(os.path.exists(marker))
+
+
+class LinkerContainerTest(unittest.TestCase):
+    """Only a container this process started is removed on shutdown."""
+
+    def _lifecycle(self, *states, run_returncode=0):
+        # states: what each successive ``docker inspect`` reports
+        probes = iter(states)
+
+        def docker(args, **kwargs):
+            if args[1] == "inspect":
+                return mock.Mock(returncode=0, stdout=next(probes), stderr="")
+            if args[1] == "run":
+                return mock.Mock(returncode=run_returncode, stdout="", stderr="")
+            return mock.Mock(returncode=0, stdout="", stderr="")
+
+        with mock.patch.object(linker_adapter.subprocess, "run") as run:
+            run.side_effect = docker
+            linker_adapter._ensure_linker_container()
+            linker_adapter.stop_linker_container()
+        return [" ".join(call.args[0][1:3]) for call in run.call_args_list]
+
+    def test_started_container_is_removed(self):
+        self.assertEqual(self._lifecycle(""), ["inspect -f", "run -d", "rm -f"])
+
+    def test_stopped_leftover_is_removed_without_force(self):
+        name = linker_adapter.SETTINGS.linker_container_name
+        self.assertEqual(
+            self._lifecycle("false\n"),
+            ["inspect -f", f"rm {name}", "run -d", "rm -f"],
+        )
+
+    def test_reused_container_is_kept(self):
+        self.assertEqual(self._lifecycle("true\n"), ["inspect -f"])
+
+    def test_lost_start_race_reuses_container(self):
+        self.assertEqual(
+            self._lifecycle("", "true\n", run_returncode=125),
+            ["inspect -f", "run -d", "inspect -f"],
+        )
+
+    def test_failed_start_raises(self):
+        with self.assertRaises(LinkerExecutionError):
+            self._lifecycle("", "", run_returncode=125)
+        self.assertFalse(linker_adapter._container_started)
+
+
+if __name__ == "__main__":
+    unittest.main()
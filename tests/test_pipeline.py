@@ -0,0 +1,88 @@
+import os
+import unittest
+from unittest import mock
+
+from lexaudit.core import pipeline
+from lexaudit.core.pipeline import LexAuditPipeline
+from lexaudit.extraction.detector import linker_adapter
+
+
+class _InlineExecutor:
+    """Stands in for ProcessPoolExecutor; records the linker state it saw."""
+
+    seen = []
+
+    def __init__(self, max_workers, initializer):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def map(self, fn, documents):
+        self.seen.append(
+            (linker_adapter._container_started, linker_adapter._container_owned)
+        )
+        return [doc["id"] for doc in documents]
+
+
+class ProcessBatchLinkerContainerTest(unittest.TestCase):
+    """process_batch(ingest_workers > 1) owns the container its workers share."""
+
+    def setUp(self):
+        _InlineExecutor.seen = []
+        patches = [
+            mock.patch.object(linker_adapter.SETTINGS, "linker_mode", "persistent"),
+            mock.patch.object(pipeline, "ProcessPoolExecutor", _InlineExecutor),
+            mock.patch.object(linker_adapter.subprocess, "run"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.run_docker = linker_adapter.subprocess.run
+        # Runs first, while docker is still mocked
+        self.addCleanup(linker_adapter.stop_linker_container)
+
+    def _process_batch(self, running):
+        def docker(args, **kwargs):
+            stdout = running if args[1] == "inspect" else ""
+            return mock.Mock(returncode=0, stdout=stdout, stderr="")
+
+        self.run_docker.side_effect = docker
+        documents = [{"id": "a"}, {"id": "b"}]
+        result = LexAuditPipeline.process_batch(
+            mock.Mock(), documents, ingest_workers=2
+        )
+        self.assertEqual(result, ["a", "b"])
+        return [" ".join(call.args[0][1:3]) for call in self.run_docker.call_args_list]
+
+    def test_started_container_is_stopped_after_the_pool(self):
+        self.assertEqual(self._process_batch(""), ["inspect -f", "run -d", "rm -f"])
+        self.assertEqual(_InlineExecutor.seen, [(True, True)])
+        self.assertFalse(linker_adapter._container_started)
+        self.assertFalse(linker_adapter._container_owned)
+
+    def test_running_container_is_left_alone(self):
+        self.assertEqual(self._process_batch("true\n"), ["inspect -f"])
+        self.assertEqual(_InlineExecutor.seen, [(True, False)])
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs os.fork")
+    def test_forked_worker_does_not_own_the_container(self):
+        self.run_docker.return_value = mock.Mock(returncode=0, stdout="", stderr="")
+        linker_adapter._ensure_linker_container()
+        self.assertTrue(linker_adapter._container_owned)
+        pid = os.fork()
+        if pid == 0:
+            ok = linker_adapter._container_started and not (
+                linker_adapter._container_owned or linker_adapter._workers
+            )
+            os._exit(0 if ok else 1)
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+        self.assertTrue(linker_adapter._container_owned)
+
+
+if __name__ == "__main__":
+    unittest.main()